@@ -0,0 +1,36 @@
+"""
+HTTP Session - shared requests session factory
+
+Every service issues its outbound API calls through a session built here, so they all get
+the same connection pool sizing and retry policy on transient errors.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_http_session() -> requests.Session:
+    """Create a requests session with pooled keep-alive connections and retries on transient errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # After the last retry, return the error response instead of raising RetryError, so callers'
+        # status-code checks still run; ignore Retry-After so a rate-limited upstream cannot stall a worker
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+            respect_retry_after_header=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+    return session
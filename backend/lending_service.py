@@ -8,40 +8,376 @@ by integrating with their respective APIs and campaign data.
 import requests
 import logging
 import os
-import subprocess
+import sys
 import json
-from typing import Dict, Any, List, Optional
-from abc import ABC, abstractmethod
-from dotenv import load_dotenv
+import copy
+import functools
+import hashlib
+import orjson
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from web3 import Web3
-
-# Load environment variables from .env file
-load_dotenv()
+from backend.http_session import create_http_session
 
 logger = logging.getLogger(__name__)
 
+# Read once at import; the app entrypoint loads .env before importing this module
+GETBLOCK_API_KEY = os.environ.get("GETBLOCK_API_KEY")
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson straight from the raw bytes"""
+    return orjson.loads(response.content)
+
 
-class ProtocolModule(ABC):
-    """Abstract base class for protocol-specific modules"""
+def _post_json(session: requests.Session, url: str, payload: Any, timeout: float) -> requests.Response:
+    """POST a JSON body serialized with orjson instead of requests' stdlib json.dumps"""
+    return session.post(url, data=orjson.dumps(payload), headers={"Content-Type": "application/json"}, timeout=timeout)
+
+
+# Canonical Multicall3 deployment (same address on Rootstock mainnet) and the aggregate3 ABI
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_layerbank_abi() -> List[Dict[str, Any]]:
+    """
+    Load LayerBank contract ABI from JSON file, parsed once per process
     
-    @abstractmethod
-    def get_apr_data(self, campaign_ids: List[str]) -> Dict[str, Any]:
+    Returns:
+        List containing contract ABI entries, empty if the file could not be loaded
+    """
+    try:
+        # Look for ABI file in the same directory
+        abi_file_path = os.path.join(os.path.dirname(__file__), "layerbank_abi.json")
+        
+        if os.path.exists(abi_file_path):
+            with open(abi_file_path, 'r') as f:
+                abi = json.load(f)
+                logger.info(f"Loaded LayerBank contract ABI from {abi_file_path}")
+                return abi
+        else:
+            logger.error(f"LayerBank ABI file not found at {abi_file_path}")
+            return []
+            
+    except Exception as e:
+        logger.error(f"Error loading LayerBank contract ABI: {str(e)}")
+        return []
+
+
+# ABI loaders by name for contracts built through LayerBankModule._contract_at
+_CONTRACT_ABIS = {
+    "layerbank_pool": _load_layerbank_abi,
+    "multicall3": lambda: MULTICALL3_ABI,
+}
+
+
+def _abi_type(param: Dict[str, Any]) -> str:
+    """Return the canonical ABI type string for an ABI parameter, expanding tuples"""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_abi_type(component) for component in param["components"])
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+# Ray = 10^27, so multiplying by 1/10^27 gives a decimal rate
+_RAY_TO_DECIMAL = 1.0 / 10**27
+
+
+# Organic rate field and APR sign for each LayerBank position type; borrow rates are a cost
+_ACTION_RATE = {
+    "LEND": ("liquidity_rate", 100.0),
+    "BORROW": ("variable_borrow_rate", -100.0),
+}
+
+
+def _organic_position_index(organic_breakdown: List[Dict[str, Any]]) -> Dict[str, Tuple[int, str, str, float]]:
+    """
+    Map each reserve's aToken / variable debt token address to its breakdown position and type
+    
+    Args:
+        organic_breakdown: Organic APR breakdown with lowercased token addresses
+        
+    Returns:
+        Dictionary mapping token address to (breakdown index, "LEND" or "BORROW", organic rate
+        field, APR scale), so the merge resolves everything it needs with one lookup
+    """
+    index = {}
+    for i, org_data in enumerate(organic_breakdown):
+        a_token = org_data.get("a_token_address")
+        variable_debt_token = org_data.get("variable_debt_token_address")
+        if a_token:
+            index[a_token] = (i, "LEND", *_ACTION_RATE["LEND"])
+        if variable_debt_token:
+            index[variable_debt_token] = (i, "BORROW", *_ACTION_RATE["BORROW"])
+    return index
+
+
+def _incentivized_index(breakdown: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map explorer address (already lowercased at ingestion) to its incentivized campaign entry
+    
+    Args:
+        breakdown: Incentivized APR breakdown from the Merkle data
+        
+    Returns:
+        Dictionary mapping explorer address to campaign entry; later campaigns win on duplicates
+    """
+    return {inc_data["explorer_address"]: inc_data for inc_data in breakdown if inc_data.get("explorer_address")}
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_address(address: Optional[str]) -> str:
+    """Return the canonical (lowercased, interned) form of an address, or "" if missing; memoized
+    since the same token and reserve addresses recur on every refresh"""
+    return sys.intern(address.lower()) if address else ""
+
+
+# Shared stand-in for missing nested dicts in token balances; never mutate it
+_EMPTY: Dict[str, Any] = {}
+
+
+def _as_float(value: Any) -> float:
+    """Coerce a numeric API field (number, numeric string or null) to float, 0.0 if it is not numeric"""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Return value if it is a dict, otherwise the shared empty dict"""
+    return value if isinstance(value, dict) else _EMPTY
+
+
+def _log_balances(token_balances: Optional[List[Dict]]) -> None:
+    """Log each token balance at DEBUG level"""
+    logger.debug("token_balances count: %d", len(token_balances) if token_balances else 0)
+    for i, balance in enumerate(token_balances or []):
+        token = balance.get('token') or _EMPTY
+        logger.debug("  token_balances[%d]: %s (%s) - %s", i, token.get('symbol', 'N/A'), token.get('name', 'N/A'), balance.get('value', '0'))
+
+
+# Shared worker pool for independent outbound I/O calls. Only leaf calls that never
+# submit further work are run here, so tasks cannot block waiting on each other.
+_io_executor = ThreadPoolExecutor(max_workers=20, thread_name_prefix="lending-io")
+
+# Shared pool for per-protocol APR/price calls. These may fan out further onto _io_executor,
+# so they must never run on it themselves. Each request runs its last protocol call on its own
+# thread, so only the remaining ones take a worker here.
+_protocol_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="lending-protocol")
+
+
+class TTLCache:
+    """Thread-safe in-memory LRU cache whose entries expire after a fixed time-to-live"""
+    
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key for the cache TTL"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+    
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        with self._lock:
+            self._data.clear()
+    
+    def _evict(self) -> None:
+        """Drop expired entries, falling back to the least recently used entry if none have expired"""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+
+
+class ProtocolModule:
+    """Base class for protocol-specific modules; protocols without campaign data keep the empty defaults"""
+    
+    def get_apr_data(self, campaign_ids: List[str], user_address: str = None) -> Dict[str, Any]:
         """Get APR data for the protocol"""
-        pass
+        return {"campaign_breakdowns": {}}
     
-    @abstractmethod
-    def get_price_data(self, campaign_ids: List[str]) -> Dict[str, Any]:
+    def get_price_data(self, campaign_ids: List[str], user_address: str = None) -> Dict[str, Any]:
         """Get price data for the protocol"""
-        pass
+        return {"token_prices": {}}
 
 
 class TropykusModule(ProtocolModule):
     """Tropykus protocol module for APR and price calculations using GraphQL"""
     
-    def __init__(self):
+    USER_BALANCES_QUERY = """
+    query FindManyUserBalances($where: User_balancesWhereInput!) {
+      findManyUser_balances(where: $where) {
+        markets {
+          name
+          supply_rate
+          underlying_token_price
+          underlying_token_name
+        }
+        deposits
+      }
+    }
+    """
+    # Automatic Persisted Query hash, so repeat requests can send the hash instead of the query text
+    USER_BALANCES_QUERY_HASH = hashlib.sha256(USER_BALANCES_QUERY.encode()).hexdigest()
+    
+    def __init__(self, session: Optional[requests.Session] = None):
         self.protocol_name = "Tropykus"
         self.logger = logging.getLogger(__name__)
         self.graphql_endpoint = "https://graphql1.tropykus.com/"
+        self._session = session or create_http_session()
+        # Fail fast on a hung GraphQL server; a timed-out request is retried once with a longer timeout
+        self.graphql_timeout = float(os.getenv("TROPYKUS_GRAPHQL_TIMEOUT", "8"))
+        
+        # Successful GraphQL responses keyed by lowercased user address; balances move, so keep the TTL short
+        self._graphql_cache = TTLCache(ttl=float(os.getenv("TROPYKUS_BALANCE_TTL", "15")), maxsize=1024)
+        
+        # APQ state: registered once the server has accepted the query with its hash, disabled only
+        # if the server says it does not support persisted queries; shared by the protocol worker threads
+        self._apq_enabled = True
+        self._apq_registered = False
+        self._apq_lock = threading.Lock()
+    
+    def _post_user_balances_query(self, variables: Dict[str, Any], timeout: float) -> Tuple[int, Any]:
+        """
+        Post the user balances query, sending only its persisted query hash when possible
+        
+        Falls back to the full query text if the server has not seen the hash yet or does
+        not support persisted queries.
+        
+        Args:
+            variables: GraphQL query variables
+            timeout: Timeout in seconds for each POST
+            
+        Returns:
+            Tuple of (HTTP status code, response body decoded once, or None if it was not JSON)
+        """
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": self.USER_BALANCES_QUERY_HASH}}
+        
+        with self._apq_lock:
+            send_hash_only = self._apq_enabled and self._apq_registered
+        
+        if send_hash_only:
+            status_code, body = self._read_response(_post_json(self._session, self.graphql_endpoint, {"variables": variables, "extensions": extensions}, timeout=timeout))
+            apq_error = self._persisted_query_error(status_code, body)
+            if apq_error is None:
+                return status_code, body
+            self.logger.info(f"Tropykus persisted query rejected ({apq_error}), resending full query")
+            with self._apq_lock:
+                # Transient failures (e.g. a 502) only force a re-registration, never disable APQ
+                if apq_error == "PersistedQueryNotSupported":
+                    self._apq_enabled = False
+                self._apq_registered = False
+        
+        with self._apq_lock:
+            register = self._apq_enabled
+        payload = {"query": self.USER_BALANCES_QUERY, "variables": variables}
+        if register:
+            payload["extensions"] = extensions
+        status_code, body = self._read_response(_post_json(self._session, self.graphql_endpoint, payload, timeout=timeout))
+        if not register:
+            return status_code, body
+        
+        apq_error = self._persisted_query_error(status_code, body)
+        if apq_error is None:
+            with self._apq_lock:
+                self._apq_registered = True
+        elif apq_error == "PersistedQueryNotSupported":
+            # The server rejects the extension itself, so stop sending it and retry the plain query
+            self.logger.info("Tropykus server does not support persisted queries, resending without them")
+            with self._apq_lock:
+                self._apq_enabled = False
+            del payload["extensions"]
+            status_code, body = self._read_response(_post_json(self._session, self.graphql_endpoint, payload, timeout=timeout))
+        return status_code, body
+    
+    @staticmethod
+    def _read_response(response: requests.Response) -> Tuple[int, Any]:
+        """Return the status code and the orjson-decoded body (None if not JSON) of a response"""
+        try:
+            return response.status_code, _json(response)
+        except ValueError:
+            return response.status_code, None
+    
+    @staticmethod
+    def _persisted_query_error(status_code: int, body: Any) -> Optional[str]:
+        """
+        Detect a GraphQL response that failed because of the persisted query
+        
+        Args:
+            status_code: HTTP status code of the response
+            body: Decoded response body, or None if it was not JSON
+            
+        Returns:
+            The error message if the request failed without data, otherwise None
+        """
+        if body is None:
+            return f"HTTP {status_code}"
+        if not isinstance(body, dict):
+            return None
+        errors = body.get("errors")
+        if status_code == 200 and (not errors or body.get("data")):
+            return None
+        if errors:
+            return errors[0].get("message") or "GraphQL error"
+        return f"HTTP {status_code}"
     
     def get_graphql_data(self, user_address: str) -> Dict[str, Any]:
         """
@@ -51,53 +387,41 @@ class TropykusModule(ProtocolModule):
             user_address: User wallet address
             
         Returns:
-            Dictionary containing user balance data with markets, deposits, borrows, and rates
+            Dictionary containing user balance data with markets, deposits, and supply rates
         """
         try:
-            self.logger.info(f"Getting Tropykus data for {user_address}")
+            cache_key = user_address.lower()
+            cached = self._graphql_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Using cached Tropykus data for {user_address}")
+                return cached
             
-            query = """
-            query FindManyUserBalances($where: User_balancesWhereInput!) {
-              findManyUser_balances(where: $where) {
-                markets {
-                  name
-                  supply_rate
-                  borrow_rate
-                  underlying_token_price
-                  underlying_token_name 
-                }
-                deposits
-                brute_deposits
-                brute_deposits_historic
-                brute_borrows_historic
-                borrows
-                brute_borrows
-                users {
-                  address_lowercase
-                }
-              }
-            }
-            """
+            self.logger.info(f"Getting Tropykus data for {user_address}")
             
             variables = {
                 "where": {
                     "users": {
                         "is": {
-                            "address_lowercase": { "equals": user_address.lower() }
+                            "address_lowercase": { "equals": cache_key }
                         }
                     }
                 }
             }
             
-            payload = {"query": query, "variables": variables}
-            
-            response = requests.post(self.graphql_endpoint, json=payload, timeout=30)
+            try:
+                status_code, graphql_data = self._post_user_balances_query(variables, self.graphql_timeout)
+            except requests.exceptions.Timeout:
+                self.logger.warning(f"Tropykus GraphQL request timed out after {self.graphql_timeout}s, retrying once")
+                status_code, graphql_data = self._post_user_balances_query(variables, self.graphql_timeout * 1.5)
             
-            if response.status_code != 200:
-                self.logger.error(f"GraphQL request failed with status {response.status_code}: {response.text}")
-                return {"error": f"GraphQL request failed with status {response.status_code}"}
+            if status_code != 200 or not isinstance(graphql_data, dict):
+                self.logger.error(f"GraphQL request failed with status {status_code}: {graphql_data}")
+                return {"error": f"GraphQL request failed with status {status_code}"}
             
-            return response.json()
+            # GraphQL reports query failures with HTTP 200 and an "errors" list; only cache real results
+            if graphql_data.get("data") and "errors" not in graphql_data:
+                self._graphql_cache.set(cache_key, graphql_data)
+            return graphql_data
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"GraphQL request error: {e}")
@@ -106,13 +430,44 @@ class TropykusModule(ProtocolModule):
             self.logger.error(f"Error getting Tropykus data: {e}")
             return {"error": str(e)}
     
-    def get_apr_data(self, campaign_ids: List[str], user_address: str = None) -> Dict[str, Any]:
-        """Get APR data for the protocol"""
-        return {"campaign_breakdowns": {}}
+    def _k_token_candidates(self, token_balances: Optional[List[Dict]]) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Collect the user's possible Tropykus k-tokens, lowercasing each name and symbol once
+        
+        Args:
+            token_balances: List of token balances from router service
+            
+        Returns:
+            List of (lowercased name, lowercased symbol, token address) in balance order
+        """
+        candidates = []
+        for token_balance in token_balances or []:
+            token = token_balance.get("token") or _EMPTY
+            token_name = (token.get("name") or "").lower()
+            token_symbol = (token.get("symbol") or "").lower()
+            if (token_name.startswith("tropykus") and "k" in token_name) or token_symbol.startswith("k"):
+                candidates.append((token_name, token_symbol, token.get("address_hash")))
+        return candidates
     
-    def get_price_data(self, campaign_ids: List[str], user_address: str = None) -> Dict[str, Any]:
-        """Get price data for the protocol"""
-        return {"token_prices": {}}
+    @staticmethod
+    def _match_k_token(candidates: List[Tuple[str, str, Optional[str]]], underlying_token_name: str) -> Optional[str]:
+        """
+        Find the k-token address for an underlying token, e.g. "Tropykus kDOC" / "kDOC" for the DOC
+        market and "kUSDRIF" for the USDRIF market; the first matching token balance wins
+        
+        Args:
+            candidates: Possible k-tokens from _k_token_candidates
+            underlying_token_name: Lowercased underlying token name of the market
+            
+        Returns:
+            The matching k-token address, or None if the user holds none
+        """
+        for token_name, token_symbol, token_address in candidates:
+            if token_name.startswith("tropykus") and token_name.endswith(underlying_token_name) and "k" in token_name:
+                return token_address
+            if token_symbol.startswith("k") and underlying_token_name in token_symbol:
+                return token_address
+        return None
     
     def get_user_portfolio_data(self, user_address: str, token_balances: List[Dict] = None) -> Dict[str, Any]:
         """
@@ -141,54 +496,32 @@ class TropykusModule(ProtocolModule):
             # Process user balance data
             user_data = graphql_data.get("data", {}).get("findManyUser_balances", [])
             portfolio_items = []
+            k_token_candidates = self._k_token_candidates(token_balances)
             
             for market_data in user_data:
-                market_name = market_data.get("markets", {}).get("name", "")
-                deposits = float(market_data.get("deposits", "0"))
-                borrows = float(market_data.get("borrows", "0"))
+                # Only include markets where user has deposits > 0; check this before parsing anything else
+                deposits = float(market_data.get("deposits") or 0)
+                if deposits <= 0:
+                    continue
                 
-                # Only include markets where user has deposits > 0
-                if deposits > 0:
-                    underlying_token_name = market_data.get("markets", {}).get("underlying_token_name", market_name)
-                    underlying_token_price = float(market_data.get("markets", {}).get("underlying_token_price", "0"))
-                    supply_rate = float(market_data.get("markets", {}).get("supply_rate", "0"))
-                    
-                    # Calculate USD value
-                    usd_value = deposits * underlying_token_price
-                    
-                    # Find the corresponding k-token address from token balances
-                    token_address = None
-                    if token_balances:
-                        for token_balance in token_balances:
-                            token_name = token_balance.get("token", {}).get("name", "").lower()
-                            token_symbol = token_balance.get("token", {}).get("symbol", "").lower()
-                            
-                            # Match k-token to underlying token
-                            # For DOC market, look for kDOC token
-                            # For USDRIF market, look for kUSDRIF token
-                            if (token_name.startswith("tropykus") and 
-                                token_name.endswith(underlying_token_name.lower()) and
-                                "k" in token_name):
-                                token_address = token_balance.get("token", {}).get("address_hash")
-                                break
-                            elif (token_symbol.startswith("k") and 
-                                  underlying_token_name.lower() in token_symbol):
-                                token_address = token_balance.get("token", {}).get("address_hash")
-                                break
-                    
-                    portfolio_item = {
-                        "protocol": "Tropykus",
-                        "market_name": market_name,
-                        "underlying_token_name": underlying_token_name,
-                        "balance": deposits,
-                        "price": underlying_token_price,
-                        "apr": supply_rate,
-                        "usd_value": usd_value,
-                        "action": "LEND",
-                        "token_address": token_address
-                    }
-                    
-                    portfolio_items.append(portfolio_item)
+                market = market_data.get("markets") or _EMPTY
+                market_name = market.get("name") or ""
+                underlying_token_name = market.get("underlying_token_name") or market_name
+                underlying_token_price = float(market.get("underlying_token_price") or 0)
+                supply_rate = float(market.get("supply_rate") or 0)
+                
+                portfolio_items.append({
+                    "protocol": "Tropykus",
+                    "market_name": market_name,
+                    "underlying_token_name": underlying_token_name,
+                    "balance": deposits,
+                    "price": underlying_token_price,
+                    "apr": supply_rate,
+                    "usd_value": deposits * underlying_token_price,
+                    "action": "LEND",
+                    # Corresponding k-token address from the user's token balances
+                    "token_address": self._match_k_token(k_token_candidates, underlying_token_name.lower())
+                })
             
             return {
                 "protocol": self.protocol_name,
@@ -204,19 +537,44 @@ class TropykusModule(ProtocolModule):
 class LayerBankModule(ProtocolModule):
     """LayerBank protocol module for APR and price calculations"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.protocol_name = "LayerBank"
         self.merkle_api_base = "https://api.merkl.xyz/v4"
+        self._opportunities_url = f"{self.merkle_api_base}/opportunities/"
         self.logger = logging.getLogger(__name__)
         
+        # Shared HTTP session so Merkle calls reuse pooled keep-alive connections
+        self._session = session or create_http_session()
+        
+        # Merkle opportunities keyed by campaign ID; campaign APRs drift slowly so a short TTL is safe
+        self._opportunity_cache = TTLCache(ttl=90, maxsize=1024)
+        # Parsed Merkle data keyed by campaign set, so get_price_data reuses what get_apr_data already
+        # traversed; holds many campaign sets since different users follow different campaigns
+        self._merkle_data_cache = TTLCache(ttl=60, maxsize=256)
+        # In-flight Merkle fetches by campaign set, so concurrent callers share one upstream fetch
+        self._merkle_inflight: Dict[frozenset, Future] = {}
+        self._merkle_inflight_lock = threading.Lock()
+        
         # Web3 setup for GetBlock
-        self.getblock_api_key = os.getenv("GETBLOCK_API_KEY")
+        self.getblock_api_key = GETBLOCK_API_KEY
         self.getblock_url = f"https://go.getblock.io/{self.getblock_api_key}"
-        self.w3 = Web3(Web3.HTTPProvider(self.getblock_url))
+        # Share the pooled session so GetBlock JSON-RPC calls reuse keep-alive connections too
+        self.w3 = Web3(Web3.HTTPProvider(self.getblock_url, session=self._session))
         
         # LayerBank contract details
         self.contract_address = "0x526D06C65777ea6D56D7A1dd47CD79230dDf72e9"
         self.contract_abi = None  # Will be loaded from JSON file
+        
+        # Contract instances by (lowercased address, ABI name), built once on first use
+        self._contracts: Dict[Tuple[str, str], Any] = {}
+        
+        # The reserves list only changes when LayerBank lists a new asset
+        self._reserves_list_cache = TTLCache(ttl=3600, maxsize=1)
+        # Batched getReserveData snapshot (reserve address -> reserve data); rates move slowly, so
+        # concurrent users share one snapshot instead of each re-reading every reserve
+        self._reserve_data_cache = TTLCache(ttl=float(os.getenv("LAYERBANK_ORGANIC_APR_TTL", "120")), maxsize=1)
+        # Reserve address -> (aToken, variableDebtToken) for every reserve seen so far; these never change
+        self._reserve_meta_cache: Dict[str, Tuple[str, str]] = {}
     
     def get_apr_data(self, campaign_ids: List[str], user_address: str = None, token_balances: List[Dict] = None) -> Dict[str, Any]:
         """
@@ -230,20 +588,67 @@ class LayerBankModule(ProtocolModule):
         Returns:
             Dictionary containing APR data for LayerBank
         """
-        try:
-            logger.info(f"LayerBank get_apr_data called with {len(token_balances) if token_balances else 0} token balances")
-            # Get organic APR from LayerBank contract via Web3
-            organic_data = self._get_organic_apr_from_contract(user_address, token_balances)
+        apr_data, _ = self._get_apr_and_merkle_data(campaign_ids, user_address, token_balances)
+        return apr_data
+    
+    def get_bundle(self, campaign_ids: List[str], user_address: str = None, token_balances: List[Dict] = None) -> Dict[str, Any]:
+        """
+        Get APR and price data together, reading the Merkle data only once
+        
+        Args:
+            campaign_ids: List of campaign IDs from Merkle API
+            user_address: User address to check for active LayerBank positions
+            token_balances: List of user's token balances from router service
+            
+        Returns:
+            Dictionary with "apr" and "price" entries shaped like get_apr_data / get_price_data
+        """
+        apr_data, merkle_data = self._get_apr_and_merkle_data(campaign_ids, user_address, token_balances)
+        if merkle_data is None:
+            price_data = self.get_price_data(campaign_ids, user_address)
+        else:
+            price_data = self._build_price_data(campaign_ids, merkle_data)
+        return {"apr": apr_data, "price": price_data}
+    
+    def _get_apr_and_merkle_data(self, campaign_ids: List[str], user_address: str = None, token_balances: List[Dict] = None) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Calculate LayerBank APR data and return the Merkle data it was derived from
+        
+        Args:
+            campaign_ids: List of campaign IDs from Merkle API
+            user_address: User address to check for active LayerBank positions
+            token_balances: List of user's token balances from router service
             
-            # Get both incentivized APR and price data from Merkle opportunities API in single call
+        Returns:
+            Tuple of (APR data, Merkle data or None if it could not be retrieved)
+        """
+        merkle_data = None
+        # Without token balances the merge yields no entries, so skip the contract read and Merkle fetch
+        if not token_balances:
+            logger.info("LayerBank get_apr_data called without token balances; returning no entries")
+            return {
+                "protocol": self.protocol_name,
+                "campaign_ids": campaign_ids,
+                "portfolio_entries": [],
+                "last_updated": None
+            }, merkle_data
+
+        try:
+            logger.info(f"LayerBank get_apr_data called with {len(token_balances)} token balances")
+            # Read organic APR from the LayerBank contract in the background while the
+            # Merkle opportunities are fetched, since they hit independent hosts
+            organic_future = _io_executor.submit(self._get_organic_apr_from_contract, user_address, token_balances)
             merkle_data = self._get_merkle_data(campaign_ids)
+            organic_data = organic_future.result()
+            
             incentivized_data = {
                 "total_apr": merkle_data["total_apr"],
-                "breakdown": merkle_data["breakdown"]
+                "breakdown": merkle_data["breakdown"],
+                "lookup": merkle_data.get("incentivized_lookup")
             }
             
             # Merge user tokens with campaign data
-            merged_data = self._merge_user_tokens_with_campaigns(organic_data, incentivized_data, campaign_ids, token_balances)
+            merged_data = self._merge_user_tokens_with_campaigns(organic_data, incentivized_data, token_balances)
             
             apr_data = {
                 "protocol": self.protocol_name,
@@ -251,10 +656,13 @@ class LayerBankModule(ProtocolModule):
                 "portfolio_entries": merged_data.get("portfolio_entries", []),
                 "last_updated": None
             }
+            # Some campaigns could not be fetched; flag it so the per-address cache does not keep this
+            if merkle_data.get("missing_campaigns"):
+                apr_data["partial"] = True
             
             total_entries = len(apr_data['portfolio_entries'])
             logger.info(f"LayerBank APR data: {total_entries} portfolio entries")
-            return apr_data
+            return apr_data, merkle_data
             
         except Exception as e:
             logger.error(f"Error getting LayerBank APR data: {str(e)}")
@@ -264,7 +672,7 @@ class LayerBankModule(ProtocolModule):
                 "portfolio_entries": [],
                 "last_updated": None,
                 "error": str(e)
-            }
+            }, merkle_data
     
     def _get_merkle_data(self, campaign_ids: List[str]) -> Dict[str, Any]:
         """
@@ -277,93 +685,194 @@ class LayerBankModule(ProtocolModule):
             Dictionary containing both incentivized APR breakdown and price data
         """
         try:
-            total_incentivized_apr = 0.0
-            breakdown = []
-            token_prices = {}
-            
-            # Get opportunities for each campaign ID from Merkle API
-            for campaign_id in campaign_ids:
-                try:
-                    # Call Merkle opportunities API with campaignId query parameter
-                    url = f"{self.merkle_api_base}/opportunities/"
-                    params = {"campaignId": campaign_id}
-                    response = requests.get(url, params=params, timeout=10)
-                    
-                    if response.status_code == 200:
-                        opportunities = response.json()
-                        
-                        # Handle both single opportunity and list of opportunities
-                        if isinstance(opportunities, list) and len(opportunities) > 0:
-                            opportunity = opportunities[0]  # Take the first opportunity
-                        elif isinstance(opportunities, dict):
-                            opportunity = opportunities
-                        else:
-                            continue
-                        
-                        # Extract required fields (we already have the correct opportunity from campaignId query)
-                        status = opportunity.get("status", "")
-                        apr = opportunity.get("apr", 0.0)
-                        action = opportunity.get("action", "")  # LEND or BORROW
-                        
-                        # Extract price and reserve from tokens section
-                        tokens = opportunity.get("tokens", [])
-                        price = 0.0
-                        reserve_address = ""
-                        explorer_address = ""
-                        
-                        if len(tokens) >= 2:
-                            # First token has the price and is the lending token
-                            price = tokens[0].get("price", 0.0)
-                            # Second token has the reserve address
-                            reserve_address = tokens[1].get("address", "")
-                            
-                            # Always use Token 0 address as explorer_address (matches portfolio cards)
-                            explorer_address = tokens[0].get("address", "").lower()
-                            
-                            # Debug logging
-                            logger.info(f"Campaign {campaign_id}: Token 0 address: {tokens[0].get('address', 'N/A')}, Token 1 address: {tokens[1].get('address', 'N/A')}")
-                            logger.info(f"Campaign {campaign_id}: Set explorer_address to: {explorer_address}")
-                        
-                        if status == "LIVE" and apr > 0:
-                            total_incentivized_apr += apr
-                            breakdown.append({
-                                "campaign_id": campaign_id,
-                                "status": status,
-                                "action": action,
-                                "apr": apr,
-                                "explorer_address": explorer_address,
-                                "price": price,
-                                "reserve_address": reserve_address
-                            })
-                            
-                            logger.info(f"Campaign {campaign_id}: {apr:.4f}% APR, Status: {status}, Action: {action}, Price: {price}, Reserve: {reserve_address}")
-                        
-                        # Store price data for price_data method
-                        if explorer_address and price > 0:
-                            token_prices[explorer_address] = {
-                                "price": price,
-                                "campaign_id": campaign_id,
-                                "reserve_address": reserve_address.lower()
-                            }
-                    
-                except Exception as e:
-                    logger.error(f"Error processing campaign {campaign_id}: {str(e)}")
-                    continue
-            
-            return {
-                "total_apr": total_incentivized_apr,
-                "breakdown": breakdown,
-                "token_prices": token_prices
-            }
+            cache_key = frozenset(campaign_ids)
+            cached = self._merkle_data_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Coalesce concurrent lookups of the same campaign set onto a single fetch
+            with self._merkle_inflight_lock:
+                inflight = self._merkle_inflight.get(cache_key)
+                if inflight is None:
+                    future = Future()
+                    self._merkle_inflight[cache_key] = future
+            if inflight is not None:
+                return inflight.result()
+            
+            try:
+                merkle_data = self._fetch_merkle_data(campaign_ids)
+                # Only cache complete results, so failed campaigns are retried on the next call
+                if not merkle_data["missing_campaigns"]:
+                    self._merkle_data_cache.set(cache_key, merkle_data)
+                future.set_result(merkle_data)
+                return merkle_data
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._merkle_inflight_lock:
+                    del self._merkle_inflight[cache_key]
             
         except Exception as e:
             logger.error(f"Error getting Merkle data: {str(e)}")
             return {
                 "total_apr": 0.0,
                 "breakdown": [],
-                "token_prices": {}
+                "incentivized_lookup": {},
+                "token_prices": {},
+                "missing_campaigns": list(campaign_ids)
             }
     
+    def _fetch_merkle_data(self, campaign_ids: List[str]) -> Dict[str, Any]:
+        """
+        Fetch Merkle opportunities and parse them into incentivized APR breakdown and price data
+        
+        Args:
+            campaign_ids: List of campaign IDs to query
+            
+        Returns:
+            Dictionary containing both incentivized APR breakdown and price data
+        """
+        total_incentivized_apr = 0.0
+        breakdown = []
+        token_prices = {}
+        missing_campaigns = []
+        
+        # Fetch opportunities for all campaign IDs up front, then parse in a single pass
+        opportunities = self._get_opportunities(campaign_ids)
+        
+        for campaign_id in campaign_ids:
+            opportunity = opportunities.get(campaign_id)
+            if opportunity is None:
+                missing_campaigns.append(campaign_id)
+                continue
+            if not isinstance(opportunity, dict):
+                logger.warning("Skipping malformed Merkle opportunity for campaign %s", campaign_id)
+                continue
+            
+            # Validate the fields once here, so one malformed opportunity cannot fail the whole parse
+            status = opportunity.get("status") or ""
+            apr = _as_float(opportunity.get("apr"))
+            action = opportunity.get("action") or ""  # LEND or BORROW
+            
+            # Extract price and reserve from tokens section
+            tokens = opportunity.get("tokens")
+            price = 0.0
+            reserve_address = ""
+            explorer_address = ""
+            
+            is_live = status == "LIVE" and apr > 0
+            
+            if isinstance(tokens, list) and len(tokens) >= 2:
+                # First token has the price and is the lending token; second token has the reserve address
+                lending_token, reserve_token = _as_dict(tokens[0]), _as_dict(tokens[1])
+                price = _as_float(lending_token.get("price"))
+                # Campaigns that are neither live nor priced record nothing, so skip normalizing their addresses
+                if not is_live and not price > 0:
+                    continue
+                raw_explorer_address = lending_token.get("address")
+                raw_reserve_address = reserve_token.get("address")
+                reserve_address = _normalize_address(raw_reserve_address) if isinstance(raw_reserve_address, str) else ""
+                
+                # Always use Token 0 address as explorer_address (matches portfolio cards)
+                explorer_address = _normalize_address(raw_explorer_address) if isinstance(raw_explorer_address, str) else ""
+                
+                logger.debug("Campaign %s: Token 0 address: %s, Token 1 address: %s", campaign_id, raw_explorer_address or "N/A", raw_reserve_address or "N/A")
+            
+            if is_live:
+                total_incentivized_apr += apr
+                breakdown.append({
+                    "campaign_id": campaign_id,
+                    "status": status,
+                    "action": action,
+                    "apr": apr,
+                    "explorer_address": explorer_address,
+                    "price": price,
+                    "reserve_address": reserve_address
+                })
+                
+                logger.debug("Campaign %s: %.4f%% APR, Status: %s, Action: %s, Price: %s, Reserve: %s", campaign_id, apr, status, action, price, reserve_address)
+            
+            # Store price data for price_data method
+            if explorer_address and price > 0:
+                token_prices[explorer_address] = {
+                    "price": price,
+                    "campaign_id": campaign_id,
+                    "reserve_address": reserve_address
+                }
+        
+        return {
+            "total_apr": total_incentivized_apr,
+            "breakdown": breakdown,
+            # Built once here so every merge against this (cached) Merkle data reuses it
+            "incentivized_lookup": _incentivized_index(breakdown),
+            "token_prices": token_prices,
+            # Campaigns whose opportunity fetch failed; a non-empty list keeps this result out of the caches
+            "missing_campaigns": missing_campaigns
+        }
+    
+    def _get_opportunities(self, campaign_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get Merkle opportunities for a list of campaign IDs with as few requests as possible
+        
+        Duplicate campaign IDs are collapsed and fresh entries are served from the TTL cache,
+        so only the remaining misses are fetched (concurrently) from the Merkle API.
+        
+        Args:
+            campaign_ids: Campaign IDs to query
+            
+        Returns:
+            Dictionary mapping each campaign ID to its opportunity, or None if it could not be fetched
+        """
+        opportunities = {}
+        missing = []
+        for campaign_id in dict.fromkeys(campaign_ids):
+            opportunity = self._opportunity_cache.get(campaign_id)
+            opportunities[campaign_id] = opportunity
+            if opportunity is None:
+                missing.append(campaign_id)
+        
+        if missing:
+            logger.info(f"Fetching {len(missing)} of {len(opportunities)} Merkle opportunities ({len(opportunities) - len(missing)} cached)")
+            # A single miss is fetched on this thread; only fan out when there is something to overlap
+            fetched = [self._fetch_opportunity(missing[0])] if len(missing) == 1 else _io_executor.map(self._fetch_opportunity, missing)
+            for campaign_id, opportunity in zip(missing, fetched):
+                opportunities[campaign_id] = opportunity
+                if opportunity is not None:
+                    self._opportunity_cache.set(campaign_id, opportunity)
+        
+        return opportunities
+    
+    def _fetch_opportunity(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the Merkle opportunity for a single campaign ID
+        
+        Args:
+            campaign_id: Campaign ID to query
+            
+        Returns:
+            Opportunity dictionary, or None if the request failed or returned nothing
+        """
+        try:
+            # Call Merkle opportunities API with campaignId query parameter
+            response = self._session.get(self._opportunities_url, params={"campaignId": campaign_id}, timeout=10)
+            
+            if response.status_code != 200:
+                return None
+            
+            opportunities = _json(response)
+            
+            # Handle both single opportunity and list of opportunities
+            if isinstance(opportunities, list) and len(opportunities) > 0:
+                return opportunities[0]  # Take the first opportunity
+            elif isinstance(opportunities, dict):
+                return opportunities
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error fetching campaign {campaign_id}: {str(e)}")
+            return None
+    
     def _load_contract_abi(self) -> Dict[str, Any]:
         """
         Load LayerBank contract ABI from JSON file
@@ -371,22 +880,43 @@ class LayerBankModule(ProtocolModule):
         Returns:
             Dictionary containing contract ABI
         """
-        try:
-            # Look for ABI file in the same directory
-            abi_file_path = os.path.join(os.path.dirname(__file__), "layerbank_abi.json")
-            
-            if os.path.exists(abi_file_path):
-                with open(abi_file_path, 'r') as f:
-                    self.contract_abi = json.load(f)
-                    logger.info(f"Loaded LayerBank contract ABI from {abi_file_path}")
-                    return self.contract_abi
-            else:
-                logger.error(f"LayerBank ABI file not found at {abi_file_path}")
-                return {}
-                
-        except Exception as e:
-            logger.error(f"Error loading LayerBank contract ABI: {str(e)}")
-            return {}
+        self.contract_abi = _load_layerbank_abi()
+        return self.contract_abi
+    
+    def _contract_at(self, address: str, abi_name: str):
+        """
+        Get a contract instance for an address and named ABI, building it once per module instance
+        
+        Args:
+            address: Contract address
+            abi_name: Key into _CONTRACT_ABIS
+            
+        Returns:
+            Web3 contract instance, or None if the ABI is not available
+        """
+        key = (address.lower(), abi_name)
+        contract = self._contracts.get(key)
+        if contract is None:
+            abi = _CONTRACT_ABIS[abi_name]()
+            if not abi:
+                return None
+            
+            contract = self.w3.eth.contract(address=self.w3.to_checksum_address(address), abi=abi)
+            self._contracts[key] = contract
+        return contract
+    
+    def _get_contract(self):
+        """
+        Get the LayerBank pool contract instance
+        
+        Returns:
+            Web3 contract instance, or None if the ABI is not available
+        """
+        # Load contract ABI if not already loaded
+        if not self.contract_abi:
+            self._load_contract_abi()
+        
+        return self._contract_at(self.contract_address, "layerbank_pool")
     
     def _get_organic_apr_from_contract(self, user_address: str = None, token_balances: List[Dict] = None) -> Dict[str, Any]:
         """
@@ -400,63 +930,56 @@ class LayerBankModule(ProtocolModule):
             Dictionary containing organic APR breakdown
         """
         try:
-            # Load contract ABI if not already loaded
-            if not self.contract_abi:
-                self._load_contract_abi()
-            
-            if not self.contract_abi:
+            # Get the (cached) contract instance
+            contract = self._get_contract()
+            if contract is None:
                 logger.error("LayerBank contract ABI not available")
                 return {"breakdown": []}
             
-            # Check Web3 connection
-            if not self.w3.is_connected():
-                logger.error("Web3 not connected to GetBlock")
-                return {"breakdown": []}
-            
-            logger.info(f"Connected to Rootstock via GetBlock: {self.w3.is_connected()}")
-            
-            # Create contract instance
-            contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.contract_address),
-                abi=self.contract_abi
-            )
-            
             # Extract user's LayerBank token addresses from token balances
             user_layerbank_tokens = set()
             if token_balances:
                 for balance in token_balances:
-                    token_address = balance.get("token", {}).get("address_hash", "").lower()
-                    token = balance.get("token", {})
-                    symbol = token.get("symbol", "")
-                    name = token.get("name", "")
-                    value = balance.get("value", "0")
+                    token = balance.get("token") or _EMPTY
+                    token_address = _normalize_address(token.get("address_hash"))
                     
-                    logger.info(f"Checking token: {symbol} ({name}) - {value}")
-                    logger.info(f"  Token address: '{token_address}'")
+                    logger.debug("Checking token: %s (%s) - %s, address='%s'", token.get("symbol", ""), token.get("name", ""), balance.get("value", "0"), token_address)
                     
                     if token_address:
                         user_layerbank_tokens.add(token_address)
-                        logger.info(f"Found user LayerBank token: {token_address}")
-                    else:
-                        logger.info(f"  Not adding token: address='{token_address}'")
             
+            user_layerbank_tokens = frozenset(user_layerbank_tokens)
             logger.info(f"User has {len(user_layerbank_tokens)} LayerBank tokens: {list(user_layerbank_tokens)}")
             
+            # Without user tokens the merge step produces no entries, so skip reserve enumeration entirely
+            if not user_layerbank_tokens:
+                logger.info("No user LayerBank tokens; skipping reserve enumeration")
+                return {"breakdown": []}
+            
             breakdown = []
+            add_reserve = breakdown.append
             found_user_positions = set()
             
             # Get reserves list
-            logger.info("Calling getReservesList() on LayerBank contract...")
-            reserves_list = contract.functions.getReservesList().call()
+            reserves_list = self._reserves_list_cache.get(self.contract_address)
+            if reserves_list is None:
+                logger.info("Calling getReservesList() on LayerBank contract...")
+                reserves_list = contract.functions.getReservesList().call()
+                self._reserves_list_cache.set(self.contract_address, reserves_list)
             logger.info(f"Found {len(reserves_list)} reserves in LayerBank")
+            
+            # Visit reserves already known to back the user's tokens first, so the early stop below
+            # fires as soon as possible
+            if self._reserve_meta_cache:
+                reserves_list = sorted(reserves_list, key=lambda reserve: user_layerbank_tokens.isdisjoint(self._reserve_meta_cache.get(reserve, ())))
                         
             # Process each reserve until we find matching wallet tokens
-            for i, reserve_address in enumerate(reserves_list):
+            for i, (reserve_address, reserve_data) in enumerate(self._iter_reserve_data(contract, reserves_list)):
                 try:
-                    logger.info(f"Processing reserve {i+1}/{len(reserves_list)}: {reserve_address}")
+                    logger.debug("Processing reserve %d/%d: %s", i + 1, len(reserves_list), reserve_address)
                     
-                    # Get reserve data
-                    reserve_data = contract.functions.getReserveData(reserve_address).call()
+                    if reserve_data is None:
+                        continue
                     
                     # Extract data from ReserveDataLegacy struct
                     # Structure: (configuration, liquidityIndex, currentLiquidityRate, variableBorrowIndex, 
@@ -464,62 +987,42 @@ class LayerBankModule(ProtocolModule):
                     #           id, aTokenAddress, stableDebtTokenAddress, variableDebtTokenAddress, 
                     #           interestRateStrategyAddress, accruedToTreasury, unbacked, isolationModeTotalDebt)
                     
-                    current_liquidity_rate = reserve_data[2]  # currentLiquidityRate
-                    current_variable_borrow_rate = reserve_data[4]  # currentVariableBorrowRate
-                    a_token_address = reserve_data[8]  # aTokenAddress
-                    variable_debt_token_address = reserve_data[10]  # variableDebtTokenAddress
-                    last_update_timestamp = reserve_data[6]  # lastUpdateTimestamp
+                    (_, _, current_liquidity_rate, _,
+                     current_variable_borrow_rate, _, _,
+                     _, a_token_address, _, variable_debt_token_address, *_) = reserve_data
                     
-                    # Convert rates from Ray (27 decimals) to percentage
-                    # Ray = 10^27, so divide by 10^25 to get percentage (10^27 / 10^25 = 100)
-                    liquidity_rate_percentage = (current_liquidity_rate / 10**25) if current_liquidity_rate > 0 else 0.0
-                    variable_borrow_rate_percentage = (current_variable_borrow_rate / 10**25) if current_variable_borrow_rate > 0 else 0.0
+                    # Normalize addresses once; everything downstream compares lowercased addresses
+                    a_token_address = _normalize_address(a_token_address)
+                    variable_debt_token_address = _normalize_address(variable_debt_token_address)
+                    self._reserve_meta_cache[reserve_address] = (a_token_address, variable_debt_token_address)
                     
-                    # Convert timestamp to readable format
-                    from datetime import datetime
-                    last_update = datetime.fromtimestamp(last_update_timestamp).isoformat() if last_update_timestamp > 0 else ""
+                    # Convert rates from Ray (27 decimals) straight to decimal rates
+                    liquidity_rate = current_liquidity_rate * _RAY_TO_DECIMAL if current_liquidity_rate > 0 else 0.0
+                    variable_borrow_rate = current_variable_borrow_rate * _RAY_TO_DECIMAL if current_variable_borrow_rate > 0 else 0.0
                     
-                    # Check if user has positions in this reserve
-                    user_has_position = False
-                    if user_layerbank_tokens:
-                        a_token_lower = a_token_address.lower()
-                        variable_debt_token_lower = variable_debt_token_address.lower()
-                        
-                        if a_token_lower in user_layerbank_tokens:
-                            user_has_position = True
-                            found_user_positions.add(a_token_lower)
-                            logger.info(f"User has LEND position: {a_token_lower}")
-                        
-                        if variable_debt_token_lower in user_layerbank_tokens:
-                            user_has_position = True
-                            found_user_positions.add(variable_debt_token_lower)
-                            logger.info(f"User has BORROW position: {variable_debt_token_lower}")
+                    # Check if user has positions (aToken and/or variable debt token) in this reserve
+                    hits = user_layerbank_tokens.intersection((a_token_address, variable_debt_token_address))
+                    if hits:
+                        found_user_positions |= hits
+                        logger.debug("User has positions in reserve %s: %s", reserve_address, hits)
                     
                     # Always include reserves since we only reach this service if user has lending evidence
-                    reserve_entry = {
-                        "reserve": reserve_address.lower(),
-                        "liquidity_rate": liquidity_rate_percentage / 100,  # Convert to decimal for consistency
-                        "variable_borrow_rate": variable_borrow_rate_percentage / 100,  # Convert to decimal for consistency
-                        "latest_update": last_update,
-                        "a_token_address": a_token_address.lower(),
-                        "variable_debt_token_address": variable_debt_token_address.lower()
-                    }
-                    
-                    breakdown.append(reserve_entry)
+                    add_reserve({
+                        "reserve": _normalize_address(reserve_address),
+                        "liquidity_rate": liquidity_rate,
+                        "variable_borrow_rate": variable_borrow_rate,
+                        "a_token_address": a_token_address,
+                        "variable_debt_token_address": variable_debt_token_address
+                    })
                     
-                    logger.info(f"Reserve {reserve_address}: liquidity_rate={liquidity_rate_percentage:.4f}%, variable_borrow_rate={variable_borrow_rate_percentage:.4f}%")
-                    logger.info(f"  aToken: {a_token_address}, variableDebtToken: {variable_debt_token_address}")
+                    logger.debug("Reserve %s: liquidity_rate=%.4f%%, variable_borrow_rate=%.4f%%, aToken: %s, variableDebtToken: %s",
+                                 reserve_address, liquidity_rate * 100, variable_borrow_rate * 100, a_token_address, variable_debt_token_address)
                     
                     # Stop processing if we found all user's LayerBank positions
-                    if user_layerbank_tokens and len(found_user_positions) >= len(user_layerbank_tokens):
+                    if len(found_user_positions) >= len(user_layerbank_tokens):
                         logger.info(f"Found all user positions ({len(found_user_positions)}/{len(user_layerbank_tokens)}), stopping reserve processing")
                         break
                     
-                    # If no user tokens provided, stop after processing first few reserves to save time
-                    if not user_layerbank_tokens and i >= 2:
-                        logger.info("No user tokens provided, stopping reserve processing after first few reserves")
-                        break
-                    
                 except Exception as e:
                     logger.error(f"Error processing reserve {reserve_address}: {str(e)}")
                     continue
@@ -531,42 +1034,148 @@ class LayerBankModule(ProtocolModule):
             logger.error(f"Error getting organic APR from contract: {str(e)}")
             return {"breakdown": []}
     
+    def _iter_reserve_data(self, contract, reserves_list: List[str]):
+        """
+        Yield getReserveData results for each reserve, batched through Multicall3 when possible
+        
+        Falls back to a single JSON-RPC batch of eth_calls if the Multicall3 call fails, and to
+        one eth_call per reserve (fetched lazily, so callers can stop early) if batching fails too.
+        Successful batches are kept as a snapshot for LAYERBANK_ORGANIC_APR_TTL seconds.
+        
+        Args:
+            contract: LayerBank pool contract instance
+            reserves_list: Reserve addresses from getReservesList()
+            
+        Yields:
+            Tuples of (reserve_address, reserve_data), with reserve_data None if that reserve failed
+        """
+        snapshot = self._reserve_data_cache.get(self.contract_address)
+        if snapshot is not None and all(reserve_address in snapshot for reserve_address in reserves_list):
+            for reserve_address in reserves_list:
+                yield reserve_address, snapshot[reserve_address]
+            return
+        
+        try:
+            batched = self._multicall_reserve_data(contract, reserves_list)
+        except Exception as e:
+            logger.warning(f"Multicall3 getReserveData batch failed, falling back to JSON-RPC batch: {str(e)}")
+            batched = None
+        
+        if batched is None:
+            try:
+                batched = self._batch_rpc_reserve_data(contract, reserves_list)
+            except Exception as e:
+                logger.warning(f"JSON-RPC getReserveData batch failed, falling back to per-reserve calls: {str(e)}")
+        
+        if batched is not None:
+            # Reverted reserves are stored as None too, so the snapshot still covers the full list
+            self._reserve_data_cache.set(self.contract_address, dict(zip(reserves_list, batched)))
+            yield from zip(reserves_list, batched)
+            return
+        
+        for reserve_address in reserves_list:
+            try:
+                yield reserve_address, contract.functions.getReserveData(reserve_address).call()
+            except Exception as e:
+                logger.error(f"Error getting reserve data for {reserve_address}: {str(e)}")
+                yield reserve_address, None
+    
+    def _multicall_reserve_data(self, contract, reserves_list: List[str]) -> List[Optional[tuple]]:
+        """
+        Fetch getReserveData for every reserve in one Multicall3 aggregate3 call
+        
+        Args:
+            contract: LayerBank pool contract instance
+            reserves_list: Reserve addresses from getReservesList()
+            
+        Returns:
+            Decoded ReserveDataLegacy tuples in reserve order, None for calls that reverted
+        """
+        target = contract.address
+        calls = [
+            (target, True, contract.encodeABI(fn_name="getReserveData", args=[reserve_address]))
+            for reserve_address in reserves_list
+        ]
+        # Multicall3 batches every getReserveData call into a single eth_call
+        results = self._contract_at(MULTICALL3_ADDRESS, "multicall3").functions.aggregate3(calls).call()
+        
+        output_types = self._reserve_data_output_types(contract)
+        reserve_data = []
+        for success, return_data in results:
+            if success and return_data:
+                reserve_data.append(self.w3.codec.decode(output_types, return_data)[0])
+            else:
+                reserve_data.append(None)
+        return reserve_data
     
+    def _batch_rpc_reserve_data(self, contract, reserves_list: List[str]) -> List[Optional[tuple]]:
+        """
+        Fetch getReserveData for every reserve as one JSON-RPC batch request of eth_calls
+        
+        Args:
+            contract: LayerBank pool contract instance
+            reserves_list: Reserve addresses from getReservesList()
+            
+        Returns:
+            Decoded ReserveDataLegacy tuples in reserve order, None for calls that failed
+        """
+        target = contract.address
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [{"to": target, "data": contract.encodeABI(fn_name="getReserveData", args=[reserve_address])}, "latest"]
+            }
+            for i, reserve_address in enumerate(reserves_list)
+        ]
+        response = _post_json(self._session, self.getblock_url, batch, timeout=15)
+        response.raise_for_status()
+        
+        results = _json(response)
+        if not isinstance(results, list):
+            raise ValueError(f"Unexpected JSON-RPC batch response: {results}")
+        
+        output_types = self._reserve_data_output_types(contract)
+        reserve_data: List[Optional[tuple]] = [None] * len(reserves_list)
+        for result in results:
+            return_data = result.get("result")
+            if return_data and return_data != "0x":
+                reserve_data[result["id"]] = self.w3.codec.decode(output_types, bytes.fromhex(return_data[2:]))[0]
+        return reserve_data
+    
+    def _reserve_data_output_types(self, contract) -> List[str]:
+        """Return the ABI output types of getReserveData for decoding raw call results"""
+        return [_abi_type(output) for output in contract.get_function_by_name("getReserveData").abi["outputs"]]
     
-    def _merge_user_tokens_with_campaigns(self, organic_data: Dict[str, Any], incentivized_data: Dict[str, Any], campaign_ids: List[str], token_balances: List[Dict]) -> Dict[str, Any]:
+    def _merge_user_tokens_with_campaigns(self, organic_data: Dict[str, Any], incentivized_data: Dict[str, Any], token_balances: List[Dict]) -> Dict[str, Any]:
         """
         Merge user's token positions with campaign data to create portfolio entries
         
         Args:
             organic_data: Organic APR data from GetBlock contract
             incentivized_data: Incentivized APR data from Merkle opportunities
-            campaign_ids: List of campaign IDs from Merkle rewards service
             token_balances: List of user's token balances
             
         Returns:
-            Dictionary containing merged APR data grouped by campaign ID
+            Dictionary with a "portfolio_entries" list holding one APR entry per matched user token
         """
         try:
             portfolio_entries = []
             organic_breakdown = organic_data.get("breakdown", [])
+            # Every entry needs an organic match, so there is nothing to merge without reserves
+            if not organic_breakdown:
+                logger.info("No organic LayerBank data to merge")
+                return {"portfolio_entries": portfolio_entries}
             incentivized_breakdown = incentivized_data.get("breakdown", [])
             
-            # Create lookup for organic data by token addresses
-            organic_lookup = {}
-            for org_data in organic_breakdown:
-                a_token = org_data.get("a_token_address", "").lower()
-                variable_debt_token = org_data.get("variable_debt_token_address", "").lower()
-                if a_token:
-                    organic_lookup[a_token] = org_data
-                if variable_debt_token:
-                    organic_lookup[variable_debt_token] = org_data
-            
-            # Create lookup for incentivized data by explorer_address
-            incentivized_lookup = {}
-            for inc_data in incentivized_breakdown:
-                explorer_address = inc_data.get("explorer_address", "").lower()
-                if explorer_address:
-                    incentivized_lookup[explorer_address] = inc_data
+            # Position index by token address (already lowercased at ingestion)
+            organic_index = _organic_position_index(organic_breakdown)
+            
+            # Create lookup for incentivized data by explorer_address (already lowercased at ingestion)
+            incentivized_lookup = incentivized_data.get("lookup")
+            if incentivized_lookup is None:
+                incentivized_lookup = _incentivized_index(incentivized_breakdown) if incentivized_breakdown else _EMPTY
             
             # Process each user token
             if not token_balances:
@@ -575,69 +1184,47 @@ class LayerBankModule(ProtocolModule):
             
             logger.info(f"Processing {len(token_balances)} token balances for merging")
             
+            # Loop invariants bound once outside the per-token loop
+            get_organic = organic_index.get
+            get_incentivized = incentivized_lookup.get
+            add_entry = portfolio_entries.append
+            log_info = logger.isEnabledFor(logging.INFO)
+            
             for balance in token_balances:
-                token_address = balance.get("token", {}).get("address_hash", "").lower()
+                token_address = _normalize_address((balance.get("token") or _EMPTY).get("address_hash"))
                 if not token_address:
                     continue
                 
-                # Get organic data for this token
-                organic_data_for_token = organic_lookup.get(token_address)
-                if not organic_data_for_token:
-                    logger.warning(f"No organic data found for user token: {token_address}")
+                # Get organic data and position type for this token
+                organic_match = get_organic(token_address)
+                if not organic_match:
+                    logger.warning("No organic data found for user token: %s", token_address)
                     continue
+                reserve_index, token_type, rate_field, scale = organic_match
+                organic_data_for_token = organic_breakdown[reserve_index]
                 
                 # Get incentivized data for this token
-                incentivized_data_for_token = incentivized_lookup.get(token_address)
-                
-                # Create portfolio entry
-                reserve_address = organic_data_for_token["reserve"]
+                incentivized_data_for_token = get_incentivized(token_address)
                 
-                # Determine if this is a LEND or BORROW token based on address match
-                a_token_address = organic_data_for_token.get("a_token_address", "").lower()
-                variable_debt_token_address = organic_data_for_token.get("variable_debt_token_address", "").lower()
-                
-                is_lend_token = token_address == a_token_address
-                is_borrow_token = token_address == variable_debt_token_address
-                
-                # Calculate organic APR based on token type
-                organic_apr = 0.0
-                if is_lend_token:
-                    organic_apr = organic_data_for_token.get("liquidity_rate", 0.0) * 100
-                elif is_borrow_token:
-                    organic_apr = -(organic_data_for_token.get("variable_borrow_rate", 0.0) * 100)
+                # Calculate organic APR based on token type (rate field and sign come from the index)
+                organic_apr = organic_data_for_token.get(rate_field, 0.0) * scale
                 
                 # Get incentivized APR (0 if no campaign data)
-                incentivized_apr = 0.0
-                price = 0.0
-                status = ""
-                campaign_id = ""
-                
-                if incentivized_data_for_token:
-                    incentivized_apr = incentivized_data_for_token.get("apr", 0.0)
-                    price = incentivized_data_for_token.get("price", 0.0)
-                    status = incentivized_data_for_token.get("status", "")
-                    campaign_id = incentivized_data_for_token.get("campaign_id", "")
+                incentivized_apr = incentivized_data_for_token.get("apr", 0.0) if incentivized_data_for_token else 0.0
                 
                 # Calculate total APR
                 total_apr = organic_apr + incentivized_apr
                 
-                # Use first campaign ID if no specific campaign found
-                if not campaign_id and campaign_ids:
-                    campaign_id = campaign_ids[0]
-                
-                # Create portfolio entry
-                portfolio_entry = {
+                # Create and add portfolio entry
+                add_entry({
                     "explorer_address": token_address,
                     "organic_apr": organic_apr,
                     "incentivized_apr": incentivized_apr,
                     "total_apr": total_apr
-                }
-                
-                # Add portfolio entry
-                portfolio_entries.append(portfolio_entry)
+                })
                 
-                token_type = "LEND" if is_lend_token else "BORROW" if is_borrow_token else "UNKNOWN"
-                logger.info(f"User token {token_address}: {organic_apr:.4f}% organic + {incentivized_apr:.4f}% incentivized = {total_apr:.4f}% total ({token_type})")
+                if log_info:
+                    logger.info("User token %s: %.4f%% organic + %.4f%% incentivized = %.4f%% total (%s)", token_address, organic_apr, incentivized_apr, total_apr, token_type)
             
             return {
                 "portfolio_entries": portfolio_entries
@@ -663,17 +1250,7 @@ class LayerBankModule(ProtocolModule):
         try:
             # Get price data from the same Merkle API call used for APR data
             merkle_data = self._get_merkle_data(campaign_ids)
-            token_prices = merkle_data["token_prices"]
-            
-            price_data = {
-                "protocol": self.protocol_name,
-                "token_prices": token_prices,
-                "campaign_ids": campaign_ids,
-                "last_updated": None
-            }
-            
-            logger.info(f"LayerBank price data retrieved for {len(token_prices)} tokens from {len(campaign_ids)} campaigns")
-            return price_data
+            return self._build_price_data(campaign_ids, merkle_data)
             
         except Exception as e:
             logger.error(f"Error getting LayerBank price data: {str(e)}")
@@ -683,20 +1260,87 @@ class LayerBankModule(ProtocolModule):
                 "campaign_ids": campaign_ids,
                 "error": str(e)
             }
+    
+    def _build_price_data(self, campaign_ids: List[str], merkle_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build LayerBank price data from parsed Merkle data
+        
+        Args:
+            campaign_ids: List of campaign IDs from Merkle API
+            merkle_data: Parsed Merkle data from _get_merkle_data
+            
+        Returns:
+            Dictionary containing price data for LayerBank tokens
+        """
+        token_prices = merkle_data["token_prices"]
+        
+        price_data = {
+            "protocol": self.protocol_name,
+            "token_prices": token_prices,
+            "campaign_ids": campaign_ids,
+            "last_updated": None
+        }
+        if merkle_data.get("missing_campaigns"):
+            price_data["partial"] = True
+        
+        logger.info(f"LayerBank price data retrieved for {len(token_prices)} tokens from {len(campaign_ids)} campaigns")
+        return price_data
 
 
 class LendingService:
     """Main lending service that coordinates multiple protocol modules"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        # One connection pool and retry policy shared by every protocol module
+        self._session = session or create_http_session()
         self.protocols = {
-            "layerbank": LayerBankModule(),
-            "tropykus": TropykusModule(),
+            "layerbank": LayerBankModule(session=self._session),
+            "tropykus": TropykusModule(session=self._session),
             # Future protocols can be added here
             # "aave": AaveModule(),
             # "compound": CompoundModule(),
         }
+        # Fused APR + price entry points for protocols that provide one, resolved once here
+        self._bundles = {
+            name: module.get_bundle for name, module in self.protocols.items() if hasattr(module, "get_bundle")
+        }
         self.logger = logging.getLogger(__name__)
+        
+        # Successful per-address lending responses, so dashboards polling the same address skip all downstream calls
+        self._address_cache = TTLCache(ttl=30, maxsize=1024)
+        
+        # Merkle rewards service, created on first use
+        self._merkle_service = None
+        # Campaign IDs per address from the rewards summary; refreshed often enough to pick up new campaigns
+        self._campaign_ids_cache = TTLCache(ttl=30, maxsize=1024)
+    
+    def _merkle(self):
+        """Return the shared MerkleRewardsService, creating it on first use"""
+        if self._merkle_service is None:
+            # Import here to avoid circular imports
+            from merkle_rewards_service import MerkleRewardsService
+            self._merkle_service = MerkleRewardsService(session=self._session)
+        return self._merkle_service
+    
+    def _get_campaign_ids(self, address: str) -> List[str]:
+        """
+        Get the Merkle campaign IDs for an address, reusing recent rewards lookups
+        
+        Args:
+            address: Wallet address to get campaign IDs for
+            
+        Returns:
+            List of campaign IDs from the address's Merkle rewards
+        """
+        cache_key = address.lower()
+        campaign_ids = self._campaign_ids_cache.get(cache_key)
+        if campaign_ids is None:
+            merkle_rewards = self._merkle().get_address_rewards_summary(address)
+            campaign_ids = merkle_rewards.get("campaign_ids", [])
+            # Failed lookups also come back without campaign IDs, so only cache non-empty results
+            if campaign_ids:
+                self._campaign_ids_cache.set(cache_key, campaign_ids)
+        return campaign_ids
     
     def get_lending_data_for_address(self, address: str, token_balances: List[Dict] = None) -> Dict[str, Any]:
         """
@@ -710,16 +1354,25 @@ class LendingService:
             Dictionary containing APR and price data for all protocols
         """
         try:
-            # Import here to avoid circular imports
-            from merkle_rewards_service import MerkleRewardsService
+            # Key on the balances too, since they decide which LayerBank positions are reported
+            cache_key = (
+                address.lower(),
+                tuple(((balance.get("token") or _EMPTY).get("address_hash"), balance.get("value")) for balance in token_balances or [])
+            )
+            cached = self._address_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Using cached lending data for address {address}")
+                # Hand out a copy so callers cannot mutate the cached response
+                return copy.deepcopy(cached)
             
             # Get campaign IDs from Merkle rewards
-            merkle_service = MerkleRewardsService()
-            merkle_rewards = merkle_service.get_address_rewards_summary(address)
-            campaign_ids = merkle_rewards.get("campaign_ids", [])
+            campaign_ids = self._get_campaign_ids(address)
             
             # Get lending data using campaign IDs and token balances
-            return self.get_lending_data(campaign_ids, address, token_balances)
+            lending_data = self.get_lending_data(campaign_ids, address, token_balances)
+            if not self._has_errors(lending_data):
+                self._address_cache.set(cache_key, copy.deepcopy(lending_data))
+            return lending_data
             
         except Exception as e:
             self.logger.error(f"Error getting lending data for address {address}: {str(e)}")
@@ -731,6 +1384,19 @@ class LendingService:
                 "error": str(e)
             }
     
+    @staticmethod
+    def _has_errors(lending_data: Dict[str, Any]) -> bool:
+        """Return True if the lending response or any protocol (or its APR / price part) carries an error
+        or is only partial"""
+        if "error" in lending_data:
+            return True
+        for protocol_data in lending_data.get("protocols", {}).values():
+            if "error" in protocol_data:
+                return True
+            if any(isinstance(part, dict) and ("error" in part or part.get("partial")) for part in protocol_data.values()):
+                return True
+        return False
+    
     def get_tropykus_portfolio_data(self, address: str, token_balances: List[Dict] = None) -> Dict[str, Any]:
         """
         Get Tropykus portfolio data for an address
@@ -766,16 +1432,13 @@ class LendingService:
             Dictionary containing APR and price data for all protocols
         """
         try:
-            # DEBUG: Print all input parameters
-            logger.info(f"=== get_lending_data DEBUG ===")
-            logger.info(f"campaign_ids: {campaign_ids}")
-            logger.info(f"user_address: {user_address}")
-            logger.info(f"token_balances count: {len(token_balances) if token_balances else 0}")
-            if token_balances:
-                for i, balance in enumerate(token_balances):
-                    token = balance.get('token', {})
-                    logger.info(f"  token_balances[{i}]: {token.get('symbol', 'N/A')} ({token.get('name', 'N/A')}) - {balance.get('value', '0')}")
-            logger.info(f"=== END get_lending_data DEBUG ===")
+            # DEBUG: Print all input parameters (skipped entirely unless DEBUG logging is on)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=== get_lending_data DEBUG ===")
+                logger.debug("campaign_ids: %s", campaign_ids)
+                logger.debug("user_address: %s", user_address)
+                _log_balances(token_balances)
+                logger.debug("=== END get_lending_data DEBUG ===")
             lending_data = {
                 "campaign_ids": campaign_ids,
                 "protocols": {},
@@ -783,36 +1446,67 @@ class LendingService:
                 "last_updated": None
             }
             
-            # Get data from each protocol
+            # Collect results per protocol so one protocol's failure doesn't affect the others
+            results = {protocol_name: {} for protocol_name in self.protocols}
+            
+            def record(protocol_name: str, kind: str, result: Any = None, error: Optional[BaseException] = None) -> None:
+                if error is not None:
+                    self.logger.error(f"Error processing {protocol_name}: {str(error)}")
+                    results[protocol_name]["error"] = str(error)
+                elif kind == "bundle":
+                    results[protocol_name].update(result)
+                else:
+                    results[protocol_name][kind] = result
+            
+            # Work out which calls actually do I/O; the ProtocolModule defaults just return empty data
+            tasks = []
             for protocol_name, protocol_module in self.protocols.items():
-                try:
-                    # Pass token balances to LayerBank module for position filtering
-                    if protocol_name == "layerbank" and hasattr(protocol_module, 'get_apr_data'):
-                        logger.info(f"Lending service passing {len(token_balances) if token_balances else 0} token balances to LayerBank module")
-                        if token_balances:
-                            for i, balance in enumerate(token_balances):
-                                token = balance.get('token', {})
-                                logger.info(f"  Token {i}: {token.get('symbol', 'N/A')} ({token.get('name', 'N/A')}) - {balance.get('value', '0')}")
-                        apr_data = protocol_module.get_apr_data(campaign_ids, user_address, token_balances)
+                # Prefer the fused APR + price path (and pass token balances for position filtering)
+                # so the protocol reads its shared campaign data only once
+                get_bundle = self._bundles.get(protocol_name)
+                if get_bundle is not None:
+                    logger.info("Lending service passing %d token balances to %s module", len(token_balances) if token_balances else 0, protocol_module.protocol_name)
+                    tasks.append((protocol_name, "bundle", get_bundle, (campaign_ids, user_address, token_balances)))
+                    continue
+                
+                for kind, method_name in (("apr", "get_apr_data"), ("price", "get_price_data")):
+                    method = getattr(protocol_module, method_name)
+                    if getattr(type(protocol_module), method_name) is getattr(ProtocolModule, method_name):
+                        record(protocol_name, kind, method(campaign_ids, user_address))
                     else:
-                        apr_data = protocol_module.get_apr_data(campaign_ids, user_address)
-                    
-                    price_data = protocol_module.get_price_data(campaign_ids, user_address)
-                    
-                    lending_data["protocols"][protocol_name] = {
-                        "apr": apr_data,
-                        "price": price_data
-                    }
-                    
+                        tasks.append((protocol_name, kind, method, (campaign_ids, user_address)))
+            
+            # Fan all but the last call out to the shared pool and run the last one on this thread,
+            # so a single-protocol request never waits on a pool worker
+            futures = {}
+            for protocol_name, kind, fn, args in tasks[:-1]:
+                futures[_protocol_executor.submit(fn, *args)] = (protocol_name, kind)
+            
+            if tasks:
+                protocol_name, kind, fn, args = tasks[-1]
+                try:
+                    record(protocol_name, kind, fn(*args))
                 except Exception as e:
-                    self.logger.error(f"Error processing {protocol_name}: {str(e)}")
+                    record(protocol_name, kind, error=e)
+            
+            for future in as_completed(futures):
+                protocol_name, kind = futures[future]
+                # Failures come back through the future itself rather than a try/except per result
+                error = future.exception()
+                if error is not None:
+                    record(protocol_name, kind, error=error)
+                else:
+                    record(protocol_name, kind, future.result())
+            
+            for protocol_name, protocol_result in results.items():
+                if "error" in protocol_result:
+                    lending_data["protocols"][protocol_name] = {"error": protocol_result["error"]}
+                else:
                     lending_data["protocols"][protocol_name] = {
-                        "error": str(e)
+                        "apr": protocol_result["apr"],
+                        "price": protocol_result["price"]
                     }
             
-            self.logger.info(f"Retrieved lending data for {len(campaign_ids)} campaigns across {len(self.protocols)} protocols")
-            return lending_data
-            
         except Exception as e:
             self.logger.error(f"Error getting lending data: {str(e)}")
             return {
@@ -820,6 +1514,9 @@ class LendingService:
                 "protocols": {},
                 "error": str(e)
             }
+        
+        self.logger.info(f"Retrieved lending data for {len(campaign_ids)} campaigns across {len(self.protocols)} protocols")
+        return lending_data
     
     def get_protocol_data(self, protocol_name: str, campaign_ids: List[str], user_address: str = None) -> Dict[str, Any]:
         """
@@ -840,9 +1537,15 @@ class LendingService:
                     "available_protocols": list(self.protocols.keys())
                 }
             
-            protocol_module = self.protocols[protocol_name]
-            apr_data = protocol_module.get_apr_data(campaign_ids, user_address)
-            price_data = protocol_module.get_price_data(campaign_ids, user_address)
+            get_bundle = self._bundles.get(protocol_name)
+            if get_bundle is not None:
+                # Fused path reads the protocol's shared campaign data only once
+                bundle = get_bundle(campaign_ids, user_address, None)
+                apr_data, price_data = bundle["apr"], bundle["price"]
+            else:
+                protocol_module = self.protocols[protocol_name]
+                apr_data = protocol_module.get_apr_data(campaign_ids, user_address)
+                price_data = protocol_module.get_price_data(campaign_ids, user_address)
             
             return {
                 "protocol": protocol_name,
@@ -860,6 +1563,11 @@ class LendingService:
 
 # Example usage and testing
 if __name__ == "__main__":
+    # Standalone runs bypass the app entrypoint, so load .env here
+    from dotenv import load_dotenv
+    load_dotenv()
+    GETBLOCK_API_KEY = os.environ.get("GETBLOCK_API_KEY")
+    
     lending_service = LendingService()
     
     # Test with real address to get actual campaign IDs
@@ -897,22 +1605,11 @@ if __name__ == "__main__":
     print("\n=== TROPKUS MODULE TESTING ===")
     tropykus_module = lending_service.protocols["tropykus"]
     
-    # Test user balance
+    # Test user portfolio (balances, markets and supply rates come back in one GraphQL request)
     test_address = "0x7966d2547f2cc8dde74ebaeca8ce3cb1d5cae337"
-    print(f"\nTesting Tropykus getUserBalance for address: {test_address}")
-    user_balance = tropykus_module.get_user_balance(test_address)
-    print("User Balance Result:", user_balance)
-    
-    # Test markets
-    print(f"\nTesting Tropykus getMarkets:")
-    markets = tropykus_module.get_markets()
-    print("Markets Result:", markets)
-    
-    # Test supply rate per block with real Tropykus contract
-    cusdrif_address = "0xDdf3CE45fcf080DF61ee61dac5Ddefef7ED4F46C"  # CUSDRIF contract
-    print(f"\nTesting Tropykus getSupplyRatePerBlock for CUSDRIF: {cusdrif_address}")
-    supply_rate = tropykus_module.get_supply_rate_per_block(cusdrif_address)
-    print("Supply Rate Result:", supply_rate)
+    print(f"\nTesting Tropykus portfolio data for address: {test_address}")
+    portfolio_data = tropykus_module.get_user_portfolio_data(test_address)
+    print("Portfolio Data Result:", portfolio_data)
     
     # Test APR and price data with user address
     print(f"\nTesting Tropykus APR data:")
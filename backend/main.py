@@ -12,10 +12,13 @@ import logging
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from router_service import RouterService
 
+# Load environment variables before the services read them at import time
 load_dotenv()
 
+from router_service import RouterService
+from backend.http_session import create_http_session
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,8 +26,11 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__, static_folder='.', static_url_path='')
 CORS(app)
 
+# One pooled, retrying session for the whole process: the routes below and every service use it
+http_session = create_http_session()
+
 # Initialize router service
-router_service = RouterService()
+router_service = RouterService(session=http_session)
 
 # Rootstock APIs
 ROOTSTOCK_API_BASE = "https://rootstock.blockscout.com/api/v2"
@@ -71,7 +77,7 @@ def get_token_balances(address: str):
     """
     try:
         url = f"{ROOTSTOCK_API_BASE}/addresses/{address}/token-balances"
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         
         if response.status_code != 200:
             return jsonify({
@@ -110,7 +116,7 @@ def get_native_rbtc_balance(address):
         lowercase_address = address.lower()
         url = f"{ROOTSTOCK_EXPLORER_API}/balances/address/{lowercase_address}?take=1"
         
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         
         if response.status_code != 200:
             return None
@@ -148,7 +154,7 @@ def get_address_info(address: str):
     try:
         # Get token balances directly from Blockscout API
         url = f"{ROOTSTOCK_API_BASE}/addresses/{address}/token-balances"
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         
         if response.status_code != 200:
             return jsonify({
@@ -157,18 +163,27 @@ def get_address_info(address: str):
         
         data = response.json()
         
-        # Pre-process data for router service (expects list of dicts with token and value keys)
+        # Single pass over the balances: pre-process data for router service (expects list of dicts
+        # with token and value keys) and format the response balances (excluding ERC-721 tokens to
+        # avoid duplication with NFT service)
         router_balances = []
+        all_balances = []
         for item in data:
+            token = item.get("token", {})
             router_balances.append({
                 "token": {
-                    "type": item.get("token", {}).get("type"),
-                    "symbol": item.get("token", {}).get("symbol"),
-                    "name": item.get("token", {}).get("name"),
-                    "address_hash": item.get("token", {}).get("address_hash")
+                    "type": token.get("type"),
+                    "symbol": token.get("symbol"),
+                    "name": token.get("name"),
+                    "address_hash": token.get("address_hash")
                 },
                 "value": item.get("value", "0")
             })
+            
+            # Skip ERC-721 tokens as they are handled by the NFT service
+            if token.get("type") == "ERC-721":
+                continue
+            all_balances.append(TokenBalance(item).to_dict())
         
         # Process through router service (optimized - only runs needed services)
         results = router_service.process_address(address, router_balances)
@@ -176,15 +191,6 @@ def get_address_info(address: str):
         # Get native rBTC balance from Explorer
         native_rbtc = get_native_rbtc_balance(address)
         
-        # Process and format the data for response (exclude ERC-721 tokens to avoid duplication with NFT service)
-        all_balances = []
-        for item in data:
-            # Skip ERC-721 tokens as they are handled by the NFT service
-            if item.get("token", {}).get("type") == "ERC-721":
-                continue
-            token_balance = TokenBalance(item)
-            all_balances.append(token_balance.to_dict())
-        
         if native_rbtc:
             # Add native rBTC to the beginning of the list
             native_token_data = {
@@ -218,7 +224,7 @@ def get_address_info(address: str):
                     wrbtc_url = f"https://rootstock.blockscout.com/api/v2/tokens/{wrbtc_address}"
                     
                     logger.info(f"Fetching WRBTC price from: {wrbtc_url}")
-                    response = requests.get(wrbtc_url, timeout=10)
+                    response = http_session.get(wrbtc_url, timeout=10)
                     logger.info(f"Blockscout API response status: {response.status_code}")
                     
                     if response.status_code == 200:
@@ -315,6 +321,13 @@ def export_to_excel():
     except Exception as e:
         return jsonify({"error": f"Error creating Excel file: {str(e)}"}), 500
 
+def index_token_balances(token_balances):
+    """Index token balances by lowercased token address, keeping the first match per address"""
+    balances_by_address = {}
+    for token_data in token_balances:
+        balances_by_address.setdefault((token_data["token"].get("address_hash") or "").lower(), token_data)
+    return balances_by_address
+
 def create_wallet_sheet(wb, token_balances):
     """Create Wallet sheet with token balances"""
     ws = wb.create_sheet("Wallet")
@@ -334,7 +347,7 @@ def create_wallet_sheet(wb, token_balances):
         
         # Calculate values
         balance = float(value) / (10 ** int(token.get("decimals", 18)))
-        price = float(token.get("exchange_rate", 0)) if token.get("exchange_rate") else 0
+        price = float(token.get("exchange_rate") or 0)
         usd_value = balance * price
         
         ws.cell(row=row, column=1, value=token.get("symbol", ""))
@@ -390,6 +403,7 @@ def create_portfolio_sheet(wb, data):
     
     # Lending positions - process all protocols generically
     lending_portfolio = data.get("lending_portfolio", {})
+    balances_by_address = index_token_balances(data.get("token_balances", []))
     for protocol_name, protocol_data in lending_portfolio.items():
         if isinstance(protocol_data, dict) and "portfolio_items" in protocol_data:
             # Tropykus format
@@ -415,11 +429,9 @@ def create_portfolio_sheet(wb, data):
                         
                         # Get balance from token balances
                         balance = 0
-                        token_balances = data.get("token_balances", [])
-                        for token_data in token_balances:
-                            if token_data["token"].get("address_hash", "").lower() == entry.get("explorer_address", "").lower():
-                                balance = float(token_data["value"]) / (10 ** int(token_data["token"].get("decimals", 18)))
-                                break
+                        token_data = balances_by_address.get(entry.get("explorer_address", "").lower())
+                        if token_data:
+                            balance = float(token_data["value"]) / (10 ** int(token_data["token"].get("decimals", 18)))
                         
                         usd_value = balance * price
                         action = "LEND" if entry.get("total_apr", 0) >= 0 else "BORROW"
@@ -501,7 +513,7 @@ def create_summary_sheet(wb, address, data):
     total_tokens = len(token_balances)
     total_value = sum(
         float(t["value"]) / (10 ** int(t["token"].get("decimals", 18))) * 
-        (float(t["token"].get("exchange_rate", 0)) if t["token"].get("exchange_rate") else 0) 
+        float(t["token"].get("exchange_rate") or 0) 
         for t in token_balances
     )
     nft_count = len(nft_valuations)
@@ -514,6 +526,7 @@ def create_summary_sheet(wb, address, data):
     
     # Calculate lending value generically
     lending_value = 0
+    balances_by_address = index_token_balances(token_balances)
     for protocol_name, protocol_data in lending_portfolio.items():
         if isinstance(protocol_data, dict) and "portfolio_items" in protocol_data:
             # Tropykus format
@@ -530,10 +543,9 @@ def create_summary_sheet(wb, address, data):
                             price = price_data.get("price", 0)
                         
                         balance = 0
-                        for token_data in token_balances:
-                            if token_data["token"].get("address_hash", "").lower() == entry.get("explorer_address", "").lower():
-                                balance = float(token_data["value"]) / (10 ** int(token_data["token"].get("decimals", 18)))
-                                break
+                        token_data = balances_by_address.get(entry.get("explorer_address", "").lower())
+                        if token_data:
+                            balance = float(token_data["value"]) / (10 ** int(token_data["token"].get("decimals", 18)))
                         
                         lending_value += balance * price
     
@@ -1,6 +1,8 @@
 import requests
+import orjson
 from typing import List, Dict, Any, Optional
 import logging
+from backend.http_session import create_http_session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -11,9 +13,11 @@ class MerkleRewardsService:
     Service for retrieving Merkle rewards data from Merkl API
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.merkle_api_base = "https://api.merkl.xyz/v4"
         self.rootstock_chain_id = "30"
+        # Reuse keep-alive connections to the Merkl API across calls
+        self._session = session or create_http_session()
     
     def get_user_rewards(self, address: str) -> List[Dict[str, Any]]:
         """
@@ -25,6 +29,26 @@ class MerkleRewardsService:
         Returns:
             List of reward dictionaries containing amount, token info, and USD value
         """
+        try:
+            data = self._fetch_rewards_data(address)
+            if data is None:
+                return []
+            return self._parse_rewards(data)
+            
+        except Exception as e:
+            logger.error(f"Error fetching Merkle rewards: {str(e)}")
+            return []
+    
+    def _fetch_rewards_data(self, address: str) -> Optional[Any]:
+        """
+        Fetch the raw Merkl rewards response for a given address
+        
+        Args:
+            address: Ethereum address to fetch rewards for
+            
+        Returns:
+            Decoded JSON response, or None if the request failed
+        """
         try:
             # Convert address to lowercase for API consistency
             lowercase_address = address.lower()
@@ -38,40 +62,47 @@ class MerkleRewardsService:
             }
             
             logger.info(f"Fetching Merkle rewards for address: {lowercase_address}")
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Failed to fetch Merkle rewards: {response.status_code} - {response.text}")
-                return []
-            
-            data = response.json()
-            
-            # Extract rewards from the response
-            rewards = []
-            # The API returns an array of chain objects, each containing rewards
-            if isinstance(data, list):
-                for chain_data in data:
-                    if "rewards" in chain_data:
-                        for reward_data in chain_data["rewards"]:
-                            reward_info = self._process_reward(reward_data)
-                            if reward_info:
-                                rewards.append(reward_info)
-            elif isinstance(data, dict) and "rewards" in data:
-                # Handle case where response is a single object with rewards
-                for reward_data in data["rewards"]:
-                    reward_info = self._process_reward(reward_data)
-                    if reward_info:
-                        rewards.append(reward_info)
+                return None
             
-            logger.info(f"Found {len(rewards)} Merkle rewards")
-            return rewards
+            return orjson.loads(response.content)
             
         except requests.RequestException as e:
             logger.error(f"Request error fetching Merkle rewards: {str(e)}")
-            return []
-        except Exception as e:
-            logger.error(f"Error fetching Merkle rewards: {str(e)}")
-            return []
+            return None
+    
+    def _parse_rewards(self, data: Any) -> List[Dict[str, Any]]:
+        """
+        Extract processed rewards from a Merkl rewards response
+        
+        Args:
+            data: Decoded JSON response from the rewards endpoint
+            
+        Returns:
+            List of reward dictionaries containing amount, token info, and USD value
+        """
+        # Extract rewards from the response
+        rewards = []
+        # The API returns an array of chain objects, each containing rewards
+        if isinstance(data, list):
+            for chain_data in data:
+                if "rewards" in chain_data:
+                    for reward_data in chain_data["rewards"]:
+                        reward_info = self._process_reward(reward_data)
+                        if reward_info:
+                            rewards.append(reward_info)
+        elif isinstance(data, dict) and "rewards" in data:
+            # Handle case where response is a single object with rewards
+            for reward_data in data["rewards"]:
+                reward_info = self._process_reward(reward_data)
+                if reward_info:
+                    rewards.append(reward_info)
+        
+        logger.info(f"Found {len(rewards)} Merkle rewards")
+        return rewards
     
     def _process_reward(self, reward_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -99,7 +130,7 @@ class MerkleRewardsService:
             
             # Calculate USD value
             amount_num = float(amount) / (10 ** int(token_decimals))
-            price_num = float(token_price) if token_price else 0
+            price_num = float(token_price or 0)
             usd_value = amount_num * price_num
             
             # Format values
@@ -175,8 +206,10 @@ class MerkleRewardsService:
             Dictionary containing rewards summary
         """
         try:
-            rewards = self.get_user_rewards(address)
-            campaign_ids = self._extract_campaign_ids(address)
+            # Rewards and campaign IDs come from the same endpoint, so fetch it once for both
+            data = self._fetch_rewards_data(address)
+            rewards = self._parse_rewards(data) if data is not None else []
+            campaign_ids = self._parse_campaign_ids(data) if data is not None else []
             
             if not rewards:
                 logger.info(f"No Merkle rewards found for address: {address}")
@@ -226,45 +259,42 @@ class MerkleRewardsService:
             List of campaign IDs found in the breakdowns
         """
         try:
-            lowercase_address = address.lower()
-            url = f"{self.merkle_api_base}/users/{lowercase_address}/rewards"
-            
-            params = {
-                "chainId": self.rootstock_chain_id,
-                "test": "false",
-                "claimableOnly": "true",
-                "breakdownPage": "0"
-            }
-            
-            logger.info(f"Extracting campaign IDs for address: {lowercase_address}")
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch campaign IDs: {response.status_code} - {response.text}")
+            data = self._fetch_rewards_data(address)
+            if data is None:
                 return []
-            
-            data = response.json()
-            campaign_ids = set()  # Use set to avoid duplicates
-            
-            # Extract campaign IDs from breakdowns section
-            if isinstance(data, list):
-                for chain_data in data:
-                    if "rewards" in chain_data:
-                        for reward_data in chain_data["rewards"]:
-                            # Look for breakdowns section
-                            breakdowns = reward_data.get("breakdowns", [])
-                            for breakdown in breakdowns:
-                                campaign_id = breakdown.get("campaignId")
-                                if campaign_id:
-                                    campaign_ids.add(str(campaign_id))
-            
-            campaign_ids_list = list(campaign_ids)
-            logger.info(f"Found {len(campaign_ids_list)} unique campaign IDs: {campaign_ids_list}")
-            return campaign_ids_list
+            return self._parse_campaign_ids(data)
             
         except Exception as e:
             logger.error(f"Error extracting campaign IDs: {str(e)}")
             return []
+    
+    def _parse_campaign_ids(self, data: Any) -> List[str]:
+        """
+        Extract unique campaign IDs from the breakdowns of a Merkl rewards response
+        
+        Args:
+            data: Decoded JSON response from the rewards endpoint
+            
+        Returns:
+            List of campaign IDs found in the breakdowns
+        """
+        campaign_ids = set()  # Use set to avoid duplicates
+        
+        # Extract campaign IDs from breakdowns section
+        if isinstance(data, list):
+            for chain_data in data:
+                if "rewards" in chain_data:
+                    for reward_data in chain_data["rewards"]:
+                        # Look for breakdowns section
+                        breakdowns = reward_data.get("breakdowns", [])
+                        for breakdown in breakdowns:
+                            campaign_id = breakdown.get("campaignId")
+                            if campaign_id:
+                                campaign_ids.add(str(campaign_id))
+        
+        campaign_ids_list = list(campaign_ids)
+        logger.info(f"Found {len(campaign_ids_list)} unique campaign IDs: {campaign_ids_list}")
+        return campaign_ids_list
 
 
 # Example usage and testing
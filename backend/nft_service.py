@@ -1,6 +1,8 @@
 import requests
+import orjson
 from typing import List, Dict, Any, Optional
 import logging
+from backend.http_session import create_http_session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -11,9 +13,11 @@ class NFTService:
     Service for retrieving and valuing NFT positions from Rootstock blockchain
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.blockscout_api_base = "https://rootstock.blockscout.com/api/v2"
         self.icarus_api_base = "https://omni.icarus.tools/rootstock/cush/analyticsPosition"
+        # Reuse keep-alive connections across the per-NFT valuation calls
+        self._session = session or create_http_session()
     
     def get_nft_data(self, address: str) -> List[Dict[str, Any]]:
         """
@@ -31,13 +35,13 @@ class NFTService:
             url = f"{self.blockscout_api_base}/addresses/{lowercase_address}/nft?type=ERC-721%2CERC-404%2CERC-1155"
             
             logger.info(f"Fetching NFT data for address: {lowercase_address}")
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Failed to fetch NFT data: {response.status_code} - {response.text}")
                 return []
             
-            data = response.json()
+            data = orjson.loads(response.content)
             nft_items = data.get("items", [])
             
             logger.info(f"Found {len(nft_items)} NFT items")
@@ -85,13 +89,13 @@ class NFTService:
             }
             
             logger.info(f"Fetching valuation for token_id: {token_id}, contract: {contract_address}")
-            response = requests.post(self.icarus_api_base, json=payload, timeout=10)
+            response = self._session.post(self.icarus_api_base, json=payload, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Failed to fetch valuation: {response.status_code} - {response.text}")
                 return None
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Look for the position with matching owner address
             lowercase_contract_address = contract_address.lower()
@@ -0,0 +1,417 @@
+"""
+Unit tests for the lending service
+
+Network access is stubbed out: HTTP sessions and contract calls are replaced with
+in-memory fakes, so these tests exercise only parsing, caching and concurrency logic.
+"""
+
+import threading
+import time
+
+import orjson
+import pytest
+import requests
+
+from backend import lending_service
+from backend.lending_service import LayerBankModule, TropykusModule, TTLCache
+
+
+@pytest.fixture
+def layerbank():
+    return LayerBankModule()
+
+
+@pytest.fixture
+def tropykus():
+    return TropykusModule()
+
+
+def _balance(name, symbol, address):
+    return {"token": {"name": name, "symbol": symbol, "address_hash": address}, "value": "1"}
+
+
+def test_fetch_merkle_data_skips_malformed_opportunity(layerbank, monkeypatch):
+    good = {
+        "status": "LIVE",
+        "apr": 5.0,
+        "action": "LEND",
+        "tokens": [{"address": "0xAAA", "price": 2.0}, {"address": "0xBBB"}]
+    }
+    malformed = {
+        "status": "LIVE",
+        "apr": "not-a-number",
+        "tokens": [None, {"address": 123}]
+    }
+    monkeypatch.setattr(layerbank, "_get_opportunities", lambda campaign_ids: {"bad": malformed, "good": good, "junk": ["x"]})
+
+    merkle_data = layerbank._fetch_merkle_data(["bad", "good", "junk"])
+
+    assert merkle_data["total_apr"] == 5.0
+    assert [entry["campaign_id"] for entry in merkle_data["breakdown"]] == ["good"]
+    assert merkle_data["breakdown"][0]["explorer_address"] == "0xaaa"
+    assert merkle_data["breakdown"][0]["reserve_address"] == "0xbbb"
+    assert merkle_data["token_prices"] == {"0xaaa": {"price": 2.0, "campaign_id": "good", "reserve_address": "0xbbb"}}
+
+
+def test_fetch_merkle_data_coerces_numeric_strings(layerbank, monkeypatch):
+    opportunity = {
+        "status": "LIVE",
+        "apr": "3.5",
+        "tokens": [{"address": "0xAAA", "price": "1.25"}, {"address": "0xBBB"}]
+    }
+    monkeypatch.setattr(layerbank, "_get_opportunities", lambda campaign_ids: {"c1": opportunity})
+
+    merkle_data = layerbank._fetch_merkle_data(["c1"])
+
+    assert merkle_data["total_apr"] == 3.5
+    assert merkle_data["token_prices"]["0xaaa"]["price"] == 1.25
+
+
+@pytest.mark.parametrize("balance, underlying, expected", [
+    (_balance("Tropykus kDOC", "kDOC", "0x1"), "doc", "0x1"),
+    (_balance("Some token", "kUSDRIF", "0x2"), "usdrif", "0x2"),
+    # Suffixed symbols still match on the underlying name as a substring
+    (_balance("Tropykus kDOC v2", "kDOCv2", "0x3"), "doc", "0x3"),
+    (_balance("Tropykus kRBTC", "kRBTC", "0x4"), "doc", None),
+    (_balance(None, None, "0x5"), "doc", None),
+])
+def test_match_k_token(tropykus, balance, underlying, expected):
+    candidates = tropykus._k_token_candidates([balance])
+    assert tropykus._match_k_token(candidates, underlying) == expected
+
+
+def test_match_k_token_first_balance_wins(tropykus):
+    candidates = tropykus._k_token_candidates([
+        _balance("DOC", "DOC", "0xunderlying"),
+        _balance("Tropykus kDOC", "kDOC", "0xfirst"),
+        _balance("Other", "kDOC", "0xsecond"),
+    ])
+    assert tropykus._match_k_token(candidates, "doc") == "0xfirst"
+
+
+class _FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.status_code = status_code
+        self.content = body if isinstance(body, bytes) else orjson.dumps(body)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class _FakeSession:
+    """Records POSTed JSON payloads and replays queued responses in order"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.payloads = []
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.payloads.append(orjson.loads(data))
+        return self.responses.pop(0)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(lending_service, "time", clock)
+    cache = TTLCache(ttl=10, maxsize=4)
+
+    cache.set("a", 1)
+    clock.now += 9
+    assert cache.get("a") == 1
+    clock.now += 1
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_evicts_expired_entries_before_live_ones(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(lending_service, "time", clock)
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("old", 1)
+    clock.now += 5
+    cache.set("fresh", 2)
+    cache.get("old")
+    clock.now += 6
+    cache.set("new", 3)
+
+    assert cache.get("old") is None
+    assert cache.get("fresh") == 2
+    assert cache.get("new") == 3
+
+
+def _run_concurrently(layerbank, monkeypatch, fetch_result):
+    """Run two _get_merkle_data calls while the first upstream fetch is held open"""
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fake_fetch(campaign_ids):
+        calls.append(campaign_ids)
+        started.set()
+        release.wait(5)
+        if isinstance(fetch_result, Exception):
+            raise fetch_result
+        return fetch_result
+
+    monkeypatch.setattr(layerbank, "_fetch_merkle_data", fake_fetch)
+    results = [None, None]
+
+    def call(i, campaign_ids):
+        results[i] = layerbank._get_merkle_data(campaign_ids)
+
+    first = threading.Thread(target=call, args=(0, ["c1", "c2"]))
+    second = threading.Thread(target=call, args=(1, ["c2", "c1"]))
+    first.start()
+    assert started.wait(5)
+    second.start()
+    # Give the second caller time to find the in-flight fetch before it completes
+    time.sleep(0.1)
+    release.set()
+    first.join(5)
+    second.join(5)
+    return calls, results
+
+
+def test_get_merkle_data_coalesces_concurrent_fetches(layerbank, monkeypatch):
+    merkle_data = {"total_apr": 1.0, "breakdown": [], "incentivized_lookup": {}, "token_prices": {}, "missing_campaigns": []}
+    calls, results = _run_concurrently(layerbank, monkeypatch, merkle_data)
+
+    assert len(calls) == 1
+    assert results[0] is merkle_data and results[1] is merkle_data
+    assert layerbank._merkle_inflight == {}
+    assert layerbank._merkle_data_cache.get(frozenset(["c1", "c2"])) is merkle_data
+
+
+def test_get_merkle_data_shares_fetch_failure(layerbank, monkeypatch):
+    calls, results = _run_concurrently(layerbank, monkeypatch, RuntimeError("upstream down"))
+
+    assert len(calls) == 1
+    for result in results:
+        assert sorted(result.pop("missing_campaigns")) == ["c1", "c2"]
+        assert result == {"total_apr": 0.0, "breakdown": [], "incentivized_lookup": {}, "token_prices": {}}
+    assert layerbank._merkle_inflight == {}
+    assert layerbank._merkle_data_cache.get(frozenset(["c1", "c2"])) is None
+
+
+class _FakeFunction:
+    abi = {"outputs": [{"type": "uint256"}]}
+
+
+class _FakeContract:
+    address = "0x526D06C65777ea6D56D7A1dd47CD79230dDf72e9"
+
+    def encodeABI(self, fn_name, args):
+        return f"0x{args[0]}"
+
+    def get_function_by_name(self, name):
+        return _FakeFunction()
+
+
+def test_batch_rpc_reserve_data_maps_results_by_id(layerbank):
+    encode = lambda value: "0x" + layerbank.w3.codec.encode(["uint256"], [value]).hex()
+    # Results arrive out of order, with one failed call and one empty return
+    layerbank._session = _FakeSession([_FakeResponse([
+        {"jsonrpc": "2.0", "id": 2, "result": encode(30)},
+        {"jsonrpc": "2.0", "id": 0, "result": encode(10)},
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "execution reverted"}},
+        {"jsonrpc": "2.0", "id": 3, "result": "0x"},
+    ])])
+
+    reserve_data = layerbank._batch_rpc_reserve_data(_FakeContract(), ["r0", "r1", "r2", "r3"])
+
+    assert reserve_data == [10, None, 30, None]
+    assert [call["id"] for call in layerbank._session.payloads[0]] == [0, 1, 2, 3]
+    assert [call["params"][0]["data"] for call in layerbank._session.payloads[0]] == ["0xr0", "0xr1", "0xr2", "0xr3"]
+
+
+def test_batch_rpc_reserve_data_rejects_non_batch_response(layerbank):
+    layerbank._session = _FakeSession([_FakeResponse({"jsonrpc": "2.0", "error": {"message": "batch not supported"}})])
+
+    with pytest.raises(ValueError):
+        layerbank._batch_rpc_reserve_data(_FakeContract(), ["r0"])
+
+
+_GRAPHQL_OK = {"data": {"findManyUser_balances": []}}
+
+
+def _graphql_error(message, status_code=200):
+    return _FakeResponse({"errors": [{"message": message}]}, status_code)
+
+
+def test_apq_registers_then_sends_hash_only(tropykus):
+    tropykus._session = _FakeSession([_FakeResponse(_GRAPHQL_OK), _FakeResponse(_GRAPHQL_OK)])
+
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+
+    first, second = tropykus._session.payloads
+    assert "query" in first and "extensions" in first
+    assert "query" not in second and second["extensions"]["persistedQuery"]["sha256Hash"] == TropykusModule.USER_BALANCES_QUERY_HASH
+
+
+def test_apq_resends_full_query_when_hash_unknown(tropykus):
+    tropykus._apq_registered = True
+    tropykus._session = _FakeSession([_graphql_error("PersistedQueryNotFound"), _FakeResponse(_GRAPHQL_OK)])
+
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+
+    retry = tropykus._session.payloads[1]
+    assert "query" in retry and "extensions" in retry
+    assert tropykus._apq_enabled and tropykus._apq_registered
+
+
+def test_apq_survives_transient_upstream_error(tropykus):
+    tropykus._apq_registered = True
+    tropykus._session = _FakeSession([_FakeResponse(b"<html>Bad Gateway</html>", 502), _FakeResponse(_GRAPHQL_OK)])
+
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+    assert tropykus._apq_enabled and tropykus._apq_registered
+
+
+def test_apq_disabled_when_not_supported(tropykus):
+    tropykus._apq_registered = True
+    tropykus._session = _FakeSession([
+        _graphql_error("PersistedQueryNotSupported"),
+        _FakeResponse(_GRAPHQL_OK),
+        _FakeResponse(_GRAPHQL_OK),
+    ])
+
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+
+    assert not tropykus._apq_enabled
+    for payload in tropykus._session.payloads[1:]:
+        assert "query" in payload and "extensions" not in payload
+
+
+def test_multicall_reserve_data_decodes_in_reserve_order(layerbank, monkeypatch):
+    encoded = layerbank.w3.codec.encode(["uint256"], [42])
+    seen_calls = []
+
+    class FakeAggregate:
+        def __init__(self, calls):
+            seen_calls.extend(calls)
+
+        def call(self):
+            return [(True, encoded), (False, b""), (True, b"")]
+
+    class FakeMulticall:
+        class functions:
+            aggregate3 = FakeAggregate
+
+    monkeypatch.setattr(layerbank, "_contract_at", lambda address, abi_name: FakeMulticall)
+
+    reserve_data = layerbank._multicall_reserve_data(_FakeContract(), ["r0", "r1", "r2"])
+
+    assert reserve_data == [42, None, None]
+    assert seen_calls == [(_FakeContract.address, True, "0xr0"), (_FakeContract.address, True, "0xr1"), (_FakeContract.address, True, "0xr2")]
+
+
+def test_apq_disabled_when_registration_not_supported(tropykus):
+    tropykus._session = _FakeSession([
+        _graphql_error("PersistedQueryNotSupported"),
+        _FakeResponse(_GRAPHQL_OK),
+        _FakeResponse(_GRAPHQL_OK),
+    ])
+
+    assert not tropykus._apq_registered
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+    assert tropykus._post_user_balances_query({}, timeout=1) == (200, _GRAPHQL_OK)
+
+    registration, retry, later = tropykus._session.payloads
+    assert "extensions" in registration
+    assert retry == {"query": TropykusModule.USER_BALANCES_QUERY, "variables": {}}
+    assert later == retry
+    assert not tropykus._apq_enabled and not tropykus._apq_registered
+
+
+def test_get_merkle_data_does_not_cache_partial_results(layerbank, monkeypatch):
+    opportunity = {"status": "LIVE", "apr": 2.0, "tokens": [{"address": "0xAAA", "price": 1.0}, {"address": "0xBBB"}]}
+    fetched = []
+
+    def fake_fetch_opportunity(campaign_id):
+        fetched.append(campaign_id)
+        # c2 fails on its first fetch only
+        if campaign_id == "c2" and fetched.count("c2") == 1:
+            return None
+        return opportunity
+
+    monkeypatch.setattr(layerbank, "_fetch_opportunity", fake_fetch_opportunity)
+
+    first = layerbank._get_merkle_data(["c1", "c2"])
+    assert first["missing_campaigns"] == ["c2"]
+    assert layerbank._build_price_data(["c1", "c2"], first)["partial"] is True
+
+    second = layerbank._get_merkle_data(["c1", "c2"])
+    assert second["missing_campaigns"] == []
+    # c1 comes from the per-campaign cache; only the failed c2 is fetched again
+    assert sorted(fetched) == ["c1", "c2", "c2"]
+    assert layerbank._get_merkle_data(["c1", "c2"]) is second
+
+
+def test_has_errors_rejects_partial_protocol_data():
+    from backend.lending_service import LendingService
+
+    assert LendingService._has_errors({"protocols": {"layerbank": {"apr": {}, "price": {"partial": True}}}})
+    assert not LendingService._has_errors({"protocols": {"layerbank": {"apr": {}, "price": {}}}})
+
+
+def test_get_graphql_data_does_not_cache_graphql_errors(tropykus):
+    tropykus._session = _FakeSession([
+        _graphql_error("Internal server error"),
+        _FakeResponse(_GRAPHQL_OK),
+        _FakeResponse(_GRAPHQL_OK),
+    ])
+
+    assert "errors" in tropykus.get_graphql_data("0xABC")
+    assert tropykus.get_graphql_data("0xABC") == _GRAPHQL_OK
+    assert tropykus.get_graphql_data("0xabc") == _GRAPHQL_OK
+
+    assert len(tropykus._session.payloads) == 2
+
+
+class _NoPool:
+    def submit(self, fn, *args):
+        raise AssertionError("single-protocol requests should not use the protocol pool")
+
+
+def test_get_lending_data_runs_single_protocol_inline(monkeypatch):
+    from backend.lending_service import LendingService
+
+    calls = []
+
+    def get_bundle(campaign_ids, user_address, token_balances):
+        calls.append(threading.current_thread())
+        return {"apr": {"campaign_breakdowns": {"c1": {}}}, "price": {"token_prices": {}}}
+
+    service = LendingService()
+    monkeypatch.setattr(lending_service, "_protocol_executor", _NoPool())
+    monkeypatch.setattr(service, "_bundles", {"layerbank": get_bundle})
+
+    lending_data = service.get_lending_data(["c1"], "0xabc", [])
+
+    assert calls == [threading.current_thread()]
+    assert lending_data["protocols"]["layerbank"]["apr"] == {"campaign_breakdowns": {"c1": {}}}
+    assert lending_data["protocols"]["tropykus"] == {"apr": {"campaign_breakdowns": {}}, "price": {"token_prices": {}}}
@@ -1,12 +1,16 @@
 import requests
+import orjson
 import logging
 from typing import Dict, List, Any, Optional
+from backend.http_session import create_http_session
 
 class YieldTokenService:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.midas_api_base = "https://api-prod.midas.app/api/data"
         self.merkl_api_base = "https://api.merkl.xyz/v4"
         self.logger = logging.getLogger(__name__)
+        # Reuse keep-alive connections to the Midas and Merkl APIs across calls
+        self._session = session or create_http_session()
         
         # Midas token addresses mapping
         self.midas_tokens = {
@@ -59,10 +63,10 @@ class YieldTokenService:
         Get APR data from Midas API
         """
         try:
-            response = requests.get(f"{self.midas_api_base}/apys", timeout=10)
+            response = self._session.get(f"{self.midas_api_base}/apys", timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             self.logger.info(f"Retrieved Midas APR data: {data}")
             
             return data
@@ -76,7 +80,7 @@ class YieldTokenService:
         Get price data from Merkle API for the given address
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.merkl_api_base}/users/{address}/rewards",
                 params={
                     "chainId": "30",
@@ -88,7 +92,7 @@ class YieldTokenService:
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             price_data = {}
             
             if isinstance(data, list):
@@ -10,16 +10,20 @@ from backend.nft_service import NFTService
 from backend.merkle_rewards_service import MerkleRewardsService
 from backend.yield_token_service import YieldTokenService
 from backend.lending_service import LendingService
+from backend.http_session import create_http_session
 
 logger = logging.getLogger(__name__)
 
 class RouterService:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.nft_service = None
         self.merkle_service = None
         self.yield_service = None
         self.lending_service = None
         
+        # One pooled, retrying session shared by the evidence checks and every service created below
+        self._session = session or create_http_session()
+        
         # API endpoints
         self.ROOTSTOCK_API_BASE = "https://rootstock.blockscout.com/api/v2"
         self.ROOTSTOCK_EXPLORER_API = "https://be.explorer.rootstock.io/api/v3"
@@ -67,24 +71,20 @@ class RouterService:
         }
         
         try:
-            # Check for yield tokens in token balances
+            # Check token balances for yield tokens, lending receipt tokens (heuristics) and NFTs
+            # in a single pass, stopping as soon as all three have been found
             yield_keywords = ["midas"]
             for balance in token_balances:
-                token_name = balance.get("token", {}).get("name", "").lower()
-                if any(keyword in token_name for keyword in yield_keywords):
-                    evidence["has_yield_token"] = True
-                    break
-            
-            # Check for lending receipt tokens using heuristics
-            for balance in token_balances:
-                if self._looks_like_lending_receipt(balance):
+                token = balance.get("token", {})
+                if not evidence["has_yield_token"]:
+                    token_name = token.get("name", "").lower()
+                    if any(keyword in token_name for keyword in yield_keywords):
+                        evidence["has_yield_token"] = True
+                if not evidence["has_lending"] and self._looks_like_lending_receipt(balance):
                     evidence["has_lending"] = True
-                    break
-            
-            # Check for NFTs in token balances
-            for balance in token_balances:
-                if balance.get("token", {}).get("type") == "ERC-721":
+                if not evidence["has_nfts"] and token.get("type") == "ERC-721":
                     evidence["has_nfts"] = True
+                if evidence["has_yield_token"] and evidence["has_lending"] and evidence["has_nfts"]:
                     break
             
             # Quick check for Merkle rewards (lightweight API call)
@@ -96,7 +96,7 @@ class RouterService:
                     "claimableOnly": "true",
                     "breakdownPage": "0"
                 }
-                response = requests.get(merkle_url, params=params, timeout=5)
+                response = self._session.get(merkle_url, params=params, timeout=5)
                 if response.status_code == 200:
                     data = response.json()
                     # Merkle API returns a list, not a dict
@@ -132,19 +132,19 @@ class RouterService:
         try:
             if evidence["has_nfts"] and not self.nft_service:
                 logger.info("Initializing NFT service")
-                self.nft_service = NFTService()
+                self.nft_service = NFTService(session=self._session)
             
             if evidence["has_merkle_rewards"] and not self.merkle_service:
                 logger.info("Initializing Merkle rewards service")
-                self.merkle_service = MerkleRewardsService()
+                self.merkle_service = MerkleRewardsService(session=self._session)
             
             if evidence["has_yield_token"] and not self.yield_service:
                 logger.info("Initializing yield token service")
-                self.yield_service = YieldTokenService()
+                self.yield_service = YieldTokenService(session=self._session)
             
             if evidence["has_lending"] and not self.lending_service:
                 logger.info("Initializing lending service")
-                self.lending_service = LendingService()
+                self.lending_service = LendingService(session=self._session)
                 
         except Exception as e:
             logger.error(f"Error initializing services: {str(e)}")
@@ -181,10 +181,11 @@ class RouterService:
         if self.lending_service:
             try:
                 logger.info(f"Router service calling lending service with {len(token_balances) if token_balances else 0} token balances")
-                if token_balances:
+                # Per-token lines are formatted lazily and skipped entirely when INFO is disabled
+                if token_balances and logger.isEnabledFor(logging.INFO):
                     for i, balance in enumerate(token_balances):
                         token = balance.get('token', {})
-                        logger.info(f"  Token {i}: {token.get('symbol', 'N/A')} ({token.get('name', 'N/A')}) - {balance.get('value', '0')}")
+                        logger.info("  Token %d: %s (%s) - %s", i, token.get('symbol', 'N/A'), token.get('name', 'N/A'), balance.get('value', '0'))
                 
                 data = self.lending_service.get_lending_data_for_address(address, token_balances)
                 